@@ -1,132 +1,220 @@
 #gui/help_dialog.py
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QScrollArea, QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QTextBrowser, QFrame
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont, QTextDocument
+import functools
+import html
+import textwrap
+
+# Help dialog rules, installed once on the QApplication at startup and
+# scoped to the dialog by its object name
+HELP_DIALOG_QSS = """
+    QDialog#helpDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QDialog#helpDialog QLabel {
+        color: #ffffff;
+        padding: 5px;
+    }
+    QDialog#helpDialog QTextBrowser {
+        color: #ffffff;
+        font-family: 'Segoe UI', 'Segoe UI Emoji', 'Apple Color Emoji', 'Noto Color Emoji', sans-serif;
+    }
+    QDialog#helpDialog QPushButton {
+        padding: 10px;
+        background-color: #9147ff;
+        border: none;
+        border-radius: 5px;
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QDialog#helpDialog QPushButton:hover {
+        background-color: #7c3aed;
+    }
+"""
+
+# Help sections as (title, body) pairs
+_HELP_SECTIONS = (
+    ("🎮 Adding Streamers", 
+     "• Enter a streamer's name or Twitch URL\n"
+     "• Supported formats: shroud, twitch.tv/shroud, https://www.twitch.tv/shroud\n"
+     "• Press Enter or click 'Add Streamer' button"),
+    
+    ("📺 Streamer Card", 
+     "• Shows streamer name and live status (🔴 LIVE or ⚫ Offline)\n"
+     "• Live status updates automatically every 30 seconds"),
+    
+    ("🎬 Auto Download", 
+     "• Toggle to automatically start downloading when streamer goes live\n"
+     "• Downloads continue until stream ends or manually stopped\n"
+     "• Files saved with timestamp in filename"),
+    
+    ("✂️ Auto Clip", 
+     "• Toggle to buffer the last 3 minutes of the stream\n"
+     "• Continuously updates the buffer while stream is live\n"
+     "• Click 'Save Clip' to save the buffered content"),
+    
+    ("📥 Download Button", 
+     "• Manually start/stop downloading the stream\n"
+     "• Only enabled when streamer is live\n"
+     "• Shows download progress and speed"),
+    
+    ("💾 Save Clip Button", 
+     "• Saves the last 3 minutes of buffered stream\n"
+     "• Only enabled when Auto Clip is active\n"
+     "• Clips saved with timestamp in filename"),
+    
+    ("📁 VODs Button", 
+     "• Opens the folder containing downloaded streams\n"
+     "• Each streamer can have custom download location"),
+    
+    ("🎞️ Clips Button", 
+     "• Opens the folder containing saved clips\n"
+     "• Each streamer can have custom clips location"),
+    
+    ("⚙️ Settings Button", 
+     "• Configure quality, format, and save locations\n"
+     "• Available qualities: best, source, 720p, 480p, etc.\n"
+     "• Formats: mp4, ts"),
+    
+    ("❌ Remove Button", 
+     "• Removes streamer from monitoring\n"
+     "• Stops any active downloads or clips"),
+    
+    ("📥 VOD Find/Download Tab", 
+     "• Find VODs \n"
+     "• Watch/Download the VOD through the .m3u8 file\n"
+     "• Download VODs from M3U8 URL\n"
+     "• Play in VLC before downloading\n"
+     "• Trim and download specific portions"),
+
+    ("🎬 Video Tools Tab", 
+     "• Extract frames from videos\n"
+     "• Trim videos to specific time ranges\n"
+     "• Various video processing utilities"),
+)
+
+# Heading and paragraph rules applied once to the help document rather than
+# repeated inline on every section
+_HELP_DOCUMENT_CSS = """
+    h3 { color: #9147ff; font-size: 16px; }
+    p { margin-left: 20px; margin-bottom: 10px; white-space: pre; }
+"""
+
+# Help body lines are pre-wrapped to this width, which fits the fixed dialog
+_WRAP_COLUMNS = 72
+
+# Text font followed by the platform emoji fonts, so the emoji in the help
+# text resolve against a known family instead of a full fallback scan
+_FONT_FAMILIES = ["Segoe UI", "Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji"]
+
+@functools.cache
+def _help_html():
+    """Render the help sections to HTML (built once per process)
+    
+    Body lines are wrapped here and rendered preformatted, so the text view
+    does not have to run its own line breaking.
+    """
+    parts = []
+    for section_title, section_text in _HELP_SECTIONS:
+        body = "\n".join(
+            textwrap.fill(line, width=_WRAP_COLUMNS, subsequent_indent="  ")
+            for line in section_text.split("\n")
+        )
+        parts.append(f"<h3>{html.escape(section_title)}</h3>")
+        parts.append(f"<p>{html.escape(body)}</p>")
+    return "".join(parts)
+
+@functools.cache
+def _help_document():
+    """Parse the help HTML into a document shared by every help dialog
+    
+    The document has no parent, so it outlives any QTextBrowser showing it.
+    """
+    document = QTextDocument()
+    document.setDefaultStyleSheet(_HELP_DOCUMENT_CSS)
+    document.setHtml(_help_html())
+    return document
+
+@functools.cache
+def _title_font():
+    """Bold 20px font for the dialog title (needs a running QApplication)"""
+    font = QFont()
+    font.setFamilies(_FONT_FAMILIES)
+    font.setPixelSize(20)
+    font.setBold(True)
+    return font
+
+# Shared dialog instance reused across opens
+_instance = None
 
 class HelpDialog(QDialog):
+    @classmethod
+    def open_for(cls, parent):
+        """Show the shared help dialog, creating it only when needed"""
+        global _instance
+        if _instance is None or _instance.parent() is not parent:
+            _instance = cls(parent)
+        _instance.show()
+        _instance.raise_()
+        _instance.activateWindow()
+        return _instance
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("helpDialog")
         self.setWindowTitle("Help - Twitch Tools")
         self.setFixedSize(600, 500)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-                padding: 5px;
-            }
-            QPushButton {
-                padding: 10px;
-                background-color: #9147ff;
-                border: none;
-                border-radius: 5px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #7c3aed;
-            }
-        """)
+        # Styled by the app-level HELP_DIALOG_QSS rules
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        # Closing only hides the dialog so the widget tree survives for reuse
+        self.setAttribute(Qt.WA_DeleteOnClose, False)
         
-        layout = QVBoxLayout(self)
+        QVBoxLayout(self)
         
-        # Create scrollable area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: #2b2b2b;
-            }
-        """)
-        
-        content = QWidget()
-        content_layout = QVBoxLayout(content)
+        # The body is only built the first time the dialog is shown
+        self._built = False
+    
+    def showEvent(self, event):
+        if not self._built:
+            self._build_ui()
+            self._built = True
+        super().showEvent(event)
+    
+    def _build_ui(self):
+        """Create the help content"""
+        layout = self.layout()
+        layout.setSpacing(10)
+        # Hold repaints until every child is in place so the layout settles once
+        self.setUpdatesEnabled(False)
         
         # Title
-        title = QLabel("📚 Twitch Tools Help")
+        title = QLabel()
+        title.setTextFormat(Qt.PlainText)
+        title.setText("📚 Twitch Tools Help")
+        title.setFont(_title_font())
+        title.setMargin(5)
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 20px; font-weight: bold; padding: 10px;")
-        content_layout.addWidget(title)
+        # The dialog has a fixed size, so the title never needs repainting on resize
+        title.setAttribute(Qt.WA_StaticContents, True)
+        title.setTextInteractionFlags(Qt.NoTextInteraction)
+        layout.addWidget(title)
         
-        # Help sections
-        help_sections = [
-            ("🎮 Adding Streamers", 
-             "• Enter a streamer's name or Twitch URL\n"
-             "• Supported formats: shroud, twitch.tv/shroud, https://www.twitch.tv/shroud\n"
-             "• Press Enter or click 'Add Streamer' button"),
-            
-            ("📺 Streamer Card", 
-             "• Shows streamer name and live status (🔴 LIVE or ⚫ Offline)\n"
-             "• Live status updates automatically every 30 seconds"),
-            
-            ("🎬 Auto Download", 
-             "• Toggle to automatically start downloading when streamer goes live\n"
-             "• Downloads continue until stream ends or manually stopped\n"
-             "• Files saved with timestamp in filename"),
-            
-            ("✂️ Auto Clip", 
-             "• Toggle to buffer the last 3 minutes of the stream\n"
-             "• Continuously updates the buffer while stream is live\n"
-             "• Click 'Save Clip' to save the buffered content"),
-            
-            ("📥 Download Button", 
-             "• Manually start/stop downloading the stream\n"
-             "• Only enabled when streamer is live\n"
-             "• Shows download progress and speed"),
-            
-            ("💾 Save Clip Button", 
-             "• Saves the last 3 minutes of buffered stream\n"
-             "• Only enabled when Auto Clip is active\n"
-             "• Clips saved with timestamp in filename"),
-            
-            ("📁 VODs Button", 
-             "• Opens the folder containing downloaded streams\n"
-             "• Each streamer can have custom download location"),
-            
-            ("🎞️ Clips Button", 
-             "• Opens the folder containing saved clips\n"
-             "• Each streamer can have custom clips location"),
-            
-            ("⚙️ Settings Button", 
-             "• Configure quality, format, and save locations\n"
-             "• Available qualities: best, source, 720p, 480p, etc.\n"
-             "• Formats: mp4, ts"),
-            
-            ("❌ Remove Button", 
-             "• Removes streamer from monitoring\n"
-             "• Stops any active downloads or clips"),
-            
-            ("📥 VOD Find/Download Tab", 
-             "• Find VODs \n"
-             "• Watch/Download the VOD through the .m3u8 file\n"
-             "• Download VODs from M3U8 URL\n"
-             "• Play in VLC before downloading\n"
-             "• Trim and download specific portions"),
-
-            ("🎬 Video Tools Tab", 
-             "• Extract frames from videos\n"
-             "• Trim videos to specific time ranges\n"
-             "• Various video processing utilities")
-        ]
-        
-        for section_title, section_text in help_sections:
-            # Section title
-            title_label = QLabel(section_title)
-            title_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #9147ff;")
-            content_layout.addWidget(title_label)
-            
-            # Section content
-            content_label = QLabel(section_text)
-            content_label.setWordWrap(True)
-            content_label.setStyleSheet("margin-left: 20px; margin-bottom: 10px;")
-            content_layout.addWidget(content_label)
-        
-        scroll.setWidget(content)
-        layout.addWidget(scroll)
+        # All sections go into one read-only text view; it scrolls itself and
+        # only paints the blocks that are visible
+        sections_view = QTextBrowser()
+        sections_view.setFrameStyle(QFrame.NoFrame)
+        # Let the dialog background show through instead of styling the view
+        sections_view.viewport().setAutoFillBackground(False)
+        sections_view.setLineWrapMode(QTextBrowser.NoWrap)
+        sections_view.setDocument(_help_document())
+        layout.addWidget(sections_view)
         
         # Close button
         close_button = QPushButton("Close")
-        close_button.clicked.connect(self.accept)
-        layout.addWidget(close_button)
\ No newline at end of file
+        layout.addWidget(close_button)
+        # Wire the button after the first paint; it cannot be clicked before then
+        QTimer.singleShot(0, lambda: close_button.clicked.connect(self.accept))
+        
+        self.setUpdatesEnabled(True)
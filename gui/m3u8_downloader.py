@@ -1,21 +1,27 @@
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                QLineEdit, QLabel, QTextEdit, QFileDialog,
                                QGroupBox, QComboBox, QProgressBar,
-                               QMessageBox, QApplication, QTabWidget, QScrollArea, QSpinBox, QInputDialog)
-from PySide6.QtCore import Qt, QThread, Signal, QMutex, QWaitCondition
+                               QMessageBox, QTabWidget, QScrollArea, QSpinBox, QInputDialog)
+from PySide6.QtCore import Qt, QObject, QThread, QRunnable, QThreadPool, Signal, QMutex, QWaitCondition, QTimer
 import subprocess
 import os
 import re
 import shutil
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
 from urllib.parse import urljoin, urlparse
 from datetime import datetime, timedelta
 import uuid
+import random
+from collections import deque
+from contextlib import contextmanager
 import hashlib
 import asyncio
 import aiohttp
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import time
+import socket
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -25,12 +31,91 @@ from selenium.webdriver.chrome.service import Service
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import queue
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from bisect import bisect_left, bisect_right
+from array import array
 from utils.file_naming import FileNamingUtils
 import gc
 import stat
 
+UNIX_EPOCH = datetime(1970, 1, 1)
+M3U8_SIGNATURE = b"#EXTM3U"
+
+# Date patterns used by DateParser
+_ISO_DATETIME_RE = re.compile(r'(\d{4}-\d{2}-\d{2})[T\s](\d{2}:\d{2}:\d{2})', re.IGNORECASE)
+_DMY_DATETIME_RE = re.compile(r'(\d{2})/(\d{2})/(\d{4})\s+(\d{2}:\d{2}:\d{2})', re.IGNORECASE)
+_MONTH_NAME_DATETIME_RE = re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{2}:\d{2})', re.IGNORECASE)
+_NORMALIZED_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}')
+
+# "YYYY-MM-DD HH:MM:SS" with in-range fields, for the manual VOD search input
+_TIMESTAMP_RE = re.compile(r'\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01]) ([01]\d|2[0-3]):[0-5]\d:[0-5]\d')
+
+# Streamscharts URL and date patterns used by StreamInfoExtractor
+_STREAMSCHARTS_URL_RE = re.compile(r'/channels/([^/]+)/streams/(\d+)')
+_STREAMSCHARTS_DMY_RE = re.compile(r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}(:\d{2})?$')
+_STREAMSCHARTS_DAY_MONTH_RE = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4}),?\s+(\d{2}):(\d{2})')
+_VOD_ID_RES = tuple(re.compile(pattern) for pattern in (
+    r'/streams/(\d{10,})',
+    r'/stream/(\d{10,})',
+    r'/(\d{10,})/?$',
+    r'[?&]v=(\d{10,})',
+    r'/videos/(\d{10,})',
+))
+
+# Muted segments of a VOD are served under a different suffix
+_UNMUTED_SUFFIX = '-unmuted.ts'
+_MUTED_SUFFIX = '-muted.ts'
+
+# "#EXTINF:<duration>,..." followed (after any other tags) by its segment URI,
+# matched on the raw playlist bytes
+_EXTINF_SEGMENT_RE = re.compile(
+    rb'^[ \t]*#EXTINF:([0-9.]+)[^\n]*\n(?:[ \t]*(?:#[^\n]*)?\r?\n)*[ \t]*([^\s#][^\r\n]*?)[ \t]*\r?$',
+    re.MULTILINE,
+)
+
+# lxml is optional; BeautifulSoup falls back to the stdlib parser without it
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Only <time> elements are needed from Streamscharts pages
+_TIME_ELEMENTS = SoupStrainer('time')
+
+# Sent by both the plain HTTP and the Selenium page fetches
+_BROWSER_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+def _remove_readonly(func, path, _exc_info):
+    """shutil.rmtree error hook: make the entry writable and retry (Windows compatibility)"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+# Download threads still winding down after their widget let go of them; a
+# QThread destroyed while running takes the whole process down
+_stopping_workers = set()
+
+def _keep_until_finished(worker, finished=None):
+    """Hold a reference to a running QThread or pooled task until it emits finished"""
+    _stopping_workers.add(worker)
+    (finished or worker.finished).connect(lambda: _stopping_workers.discard(worker))
+
+def _interrupt_response(response):
+    """Unblock a thread reading a urllib3 response without waiting for it
+    
+    close() can block until the reader's socket timeout, so shut the socket
+    down instead; the reader's read then fails straight away.
+    """
+    shutdown = getattr(response, 'shutdown', None)  # urllib3 >= 2.3
+    if shutdown is not None:
+        shutdown()
+        return
+    sock = getattr(getattr(response, '_connection', None), 'sock', None)
+    if sock is not None:
+        sock.shutdown(socket.SHUT_RDWR)
+
 class StyleManager:
     """Centralized style management for consistent UI"""
     
@@ -159,24 +244,19 @@ class TimeUtils:
             return 0
         
         try:
-            parts = time_str.strip().split(':')
-            if len(parts) == 3:  # HH:MM:SS
-                return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            elif len(parts) == 2:  # MM:SS
-                return int(parts[0]) * 60 + int(parts[1])
-            elif len(parts) == 1:  # SS
-                return int(parts[0])
+            # At most three fields; a fourth stays attached to the last and fails int()
+            seconds = 0
+            for part in time_str.strip().split(':', 2):
+                seconds = seconds * 60 + int(part)
+            return seconds
         except:
-            pass
-        
-        return 0
+            return 0
     
     @staticmethod
     def format_seconds(seconds):
         """Convert seconds to HH:MM:SS format"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 class DateParser:
@@ -191,6 +271,21 @@ class DateParser:
         'oct': 10, 'nov': 11, 'dec': 12
     }
     
+    # (min length, max length, required character, format), tried in order;
+    # lengths cover unpadded through zero-padded fields
+    FORMATS = (
+        (14, 19, '-', "%Y-%m-%d %H:%M:%S"),
+        (14, 19, 'T', "%Y-%m-%dT%H:%M:%S"),
+        (15, 20, 'Z', "%Y-%m-%dT%H:%M:%SZ"),
+        (17, 27, '.', "%Y-%m-%dT%H:%M:%S.%fZ"),
+        (14, 19, '/', "%d/%m/%Y %H:%M:%S"),
+        (14, 19, '/', "%m/%d/%Y %H:%M:%S"),
+        (14, 19, '-', "%d-%m-%Y %H:%M:%S"),
+        (12, 16, '-', "%d-%m-%Y %H:%M"),
+        (17, 27, ',', "%B %d, %Y %H:%M:%S"),
+        (17, 21, ',', "%b %d, %Y %H:%M:%S"),
+    )
+    
     @classmethod
     def parse_various_formats(cls, date_str):
         """Try to parse various date formats"""
@@ -209,28 +304,21 @@ class DateParser:
             if date_str.lower().startswith(prefix.lower()):
                 date_str = date_str[len(prefix):].strip()
         
-        # Try standard formats
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%d/%m/%Y %H:%M:%S",
-            "%m/%d/%Y %H:%M:%S",
-            "%d-%m-%Y %H:%M:%S",
-            "%d-%m-%Y %H:%M",
-            "%B %d, %Y %H:%M:%S",
-            "%b %d, %Y %H:%M:%S",
-        ]
-        
-        for fmt in formats:
+        # Try standard formats, skipping any the string can't possibly match
+        compact = " ".join(date_str.split())
+        length = len(compact)
+        # strptime matches literals case-insensitively
+        markers = compact.upper()
+        for min_len, max_len, marker, fmt in cls.FORMATS:
+            if not min_len <= length <= max_len or marker not in markers:
+                continue
             try:
-                dt = datetime.strptime(date_str, fmt)
-                if dt.year == 1900:
-                    dt = dt.replace(year=datetime.now().year)
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
+                dt = datetime.strptime(compact, fmt)
             except ValueError:
                 continue
+            if dt.year == 1900:
+                dt = dt.replace(year=datetime.now().year)
+            return dt.strftime("%Y-%m-%d %H:%M:%S")
         
         # Try regex patterns
         return cls._try_regex_patterns(date_str)
@@ -240,24 +328,24 @@ class DateParser:
         """Try various regex patterns to extract date"""
         patterns = [
             # ISO format
-            (r'(\d{4}-\d{2}-\d{2})[T\s](\d{2}:\d{2}:\d{2})',
+            (_ISO_DATETIME_RE,
              lambda m: f"{m.group(1)} {m.group(2)}"),
             
             # DD/MM/YYYY format
-            (r'(\d{2})/(\d{2})/(\d{4})\s+(\d{2}:\d{2}:\d{2})',
+            (_DMY_DATETIME_RE,
              lambda m: f"{m.group(3)}-{m.group(2)}-{m.group(1)} {m.group(4)}"),
             
             # Month name formats
-            (r'(\w+)\s+(\d{1,2}),?\s+(\d{4})\s+(\d{2}:\d{2})',
+            (_MONTH_NAME_DATETIME_RE,
              lambda m: cls._convert_month_format(m)),
         ]
         
         for pattern, formatter in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
+            match = pattern.search(date_str)
             if match:
                 try:
                     result = formatter(match)
-                    if result and re.match(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}', result):
+                    if result and _NORMALIZED_DATETIME_RE.match(result):
                         if not result.endswith(':00'):
                             result += ":00"
                         return result
@@ -276,38 +364,72 @@ class DateParser:
         time = match.group(4)
         return f"{year}-{month_num:02d}-{day} {time}:00"
 
-class VODFinderThread(QThread):
-    """Thread for finding VOD M3U8 URLs"""
+class VODFinderSignals(QObject):
+    """Signals emitted by VODFinderTask"""
     
     progress_update = Signal(str)
     found_url = Signal(str)
     error = Signal(str)
+    finished = Signal()  # Always last, including after a stop
+
+class VODFinderTask(QRunnable):
+    """Pooled job for finding VOD M3U8 URLs"""
+    
+    MAX_CONCURRENT_CHECKS = 64
+    # Minimum seconds between "Checking n/m" progress messages
+    PROGRESS_INTERVAL = 0.1
+    PROBE_BYTES = 64
+    NOT_FOUND_MESSAGE = "No valid M3U8 URL found"
     
     def __init__(self, streamer_name, video_id, timestamp, domains):
         super().__init__()
+        # Kept alive by its owner, which reads search_failed after it finishes
+        self.setAutoDelete(False)
+        self.signals = VODFinderSignals()
         self.streamer_name = streamer_name
         self.video_id = video_id
         self.timestamp = timestamp
         self.domains = domains
         self._should_stop = False
+        # Set when the search itself failed, so a miss is not a real "not found"
+        self.search_failed = False
+        # Probes that gave up on an error instead of getting an answer
+        self.probe_errors = 0
+        self._running = threading.Event()
     
     def stop(self):
         self._should_stop = True
     
-    async def check_m3u8_url(self, session, url, retries=3, timeout=30):
+    def is_running(self):
+        return self._running.is_set()
+    
+    async def check_m3u8_url(self, session, semaphore, url, retries=3):
         """Check if an M3U8 URL is valid"""
         for attempt in range(retries):
             if self._should_stop:
                 return None
             
             try:
-                async with session.get(url, timeout=timeout) as response:
-                    if response.status == 200:
-                        data = await response.text()
-                        if data and "#EXTM3U" in data:
-                            return url
-            except:
+                async with semaphore:
+                    # Only the playlist header is needed to recognise a hit
+                    async with session.get(url, headers={'Range': f'bytes=0-{self.PROBE_BYTES - 1}'}) as response:
+                        try:
+                            if response.status in (200, 206):
+                                # A playlist must open with the signature itself
+                                head = await response.content.readexactly(len(M3U8_SIGNATURE))
+                                if head == M3U8_SIGNATURE:
+                                    return url
+                        except asyncio.IncompleteReadError:
+                            pass
+                        finally:
+                            # Hand the connection back without reading the rest
+                            response.release()
+                        # The server answered, so retrying won't change the result
+                        return None
+            except Exception:
+                # CancelledError is not caught here, so cancelled probes stop at once
                 if attempt == retries - 1:
+                    self.probe_errors += 1
                     return None
                 continue
         
@@ -315,61 +437,88 @@ class VODFinderThread(QThread):
     
     async def find_vod_m3u8_async(self):
         """Find M3U8 URL for a Twitch VOD with timestamp offset testing"""
-        m3u8_urls = []
         base_time = datetime.strptime(self.timestamp, "%Y-%m-%d %H:%M:%S")
+        base_epoch = int((base_time - UNIX_EPOCH).total_seconds())
+        streamer_name = self.streamer_name
+        video_id = self.video_id
+        domains = tuple(self.domains)
+        
+        # Every hash input shares the "streamer_vodid_" prefix, so hash it once
+        # and copy the state for each timestamp
+        base_hash = hashlib.sha1(f"{streamer_name}_{video_id}_".encode('utf-8'))
+        
+        def url_hash(epoch_timestamp):
+            hash_state = base_hash.copy()
+            hash_state.update(str(epoch_timestamp).encode('utf-8'))
+            return hash_state.hexdigest()[:20]
+        
+        # Test every second from one minute before to one minute after the timestamp;
+        # the playlist path depends only on the timestamp, so build it once per second
+        vod_paths = [
+            f"{url_hash(epoch_timestamp)}_{streamer_name}_{video_id}_{epoch_timestamp}/chunked/index-dvr.m3u8"
+            for epoch_timestamp in range(base_epoch - 60, base_epoch + 120)
+        ]
         
-        for minute_offset in range(-1, 2):
-            if self._should_stop:
-                return None
-            
-            # Add minute offset
-            test_time = base_time + timedelta(minutes=minute_offset)
-            
-            # Generate URLs for each second within this minute
-            for seconds in range(60):
-                if self._should_stop:
-                    return None
-                
-                epoch_timestamp = int((test_time + timedelta(seconds=seconds) -
-                                     datetime(1970, 1, 1)).total_seconds())
-                
-                # Generate SHA1 hash
-                hash_input = f"{self.streamer_name}_{self.video_id}_{epoch_timestamp}"
-                url_hash = hashlib.sha1(hash_input.encode('utf-8')).hexdigest()[:20]
-                
-                # Create M3U8 URLs for each domain
-                for domain in self.domains:
-                    m3u8_url = f"{domain}{url_hash}_{self.streamer_name}_{self.video_id}_{epoch_timestamp}/chunked/index-dvr.m3u8"
-                    m3u8_urls.append(m3u8_url)
+        # Create M3U8 URLs for each domain
+        m3u8_urls = [domain + vod_path for vod_path in vod_paths for domain in domains]
+        
+        if self._should_stop:
+            return None
         
-        self.progress_update.emit(f"Generated {len(m3u8_urls)} possible URLs to check...")
-        self.progress_update.emit(f"Testing timestamps from {(base_time - timedelta(minutes=5)).strftime('%H:%M:%S')} to {(base_time + timedelta(minutes=5)).strftime('%H:%M:%S')}")
+        self.signals.progress_update.emit(f"Generated {len(m3u8_urls)} possible URLs to check...")
+        self.signals.progress_update.emit(f"Testing timestamps from {(base_time - timedelta(minutes=5)).strftime('%H:%M:%S')} to {(base_time + timedelta(minutes=5)).strftime('%H:%M:%S')}")
         
-        # Check URLs asynchronously
+        # Check URLs asynchronously with a bounded number of requests in flight
         try:
-            async with aiohttp.ClientSession() as session:
-                tasks = [self.check_m3u8_url(session, url) for url in m3u8_urls]
+            connector = aiohttp.TCPConnector(limit=self.MAX_CONCURRENT_CHECKS, limit_per_host=16, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(total=10)
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHECKS)
+            
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                pending = {
+                    asyncio.ensure_future(self.check_m3u8_url(session, semaphore, url))
+                    for url in m3u8_urls
+                }
+                checked = 0
+                last_report = 0.0
                 
-                for index, task in enumerate(asyncio.as_completed(tasks), 1):
-                    if self._should_stop:
-                        return None
-                    
-                    try:
-                        url = await task
-                        self.progress_update.emit(f"Checking {index}/{len(m3u8_urls)} URLs...")
-                        if url:
-                            return url
-                    except:
-                        continue
+                try:
+                    while pending:
+                        if self._should_stop:
+                            return None
+                        
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            checked += 1
+                            try:
+                                url = task.result()
+                            except Exception:
+                                continue
+                            if url:
+                                return url
+                        
+                        # Probes finish in bursts; report progress a few times per second
+                        now = time.monotonic()
+                        if now - last_report >= self.PROGRESS_INTERVAL:
+                            last_report = now
+                            self.signals.progress_update.emit(f"Checking {checked}/{len(m3u8_urls)} URLs...")
+                finally:
+                    # Stop probing as soon as one URL is found (or on stop/error)
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
         
         except Exception as e:
-            self.error.emit(f"Error during URL search: {str(e)}")
+            self.search_failed = True
+            # run() reports the outcome; this only explains it
+            self.signals.progress_update.emit(f"❌ Error during URL search: {str(e)}")
             return None
         
         return None
     
     def run(self):
         """Run the VOD finder"""
+        self._running.set()
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -377,29 +526,45 @@ class VODFinderThread(QThread):
             m3u8_url = loop.run_until_complete(self.find_vod_m3u8_async())
             
             if m3u8_url and not self._should_stop:
-                self.found_url.emit(m3u8_url)
+                self.signals.found_url.emit(m3u8_url)
             elif not self._should_stop:
-                self.error.emit("No valid M3U8 URL found")
+                # A miss only counts as confirmed if every probe got an answer
+                if self.probe_errors:
+                    self.search_failed = True
+                self.signals.error.emit(self.NOT_FOUND_MESSAGE)
         
         except Exception as e:
+            self.search_failed = True
             if not self._should_stop:
-                self.error.emit(f"Error: {str(e)}")
+                self.signals.error.emit(f"Error: {str(e)}")
         finally:
             loop.close()
+            self._running.clear()
+            self.signals.finished.emit()
 
 class StreamInfoExtractor:
     """Extract stream information from tracking websites"""
     
-    @staticmethod
-    def get_driver():
-        """Create and configure Chrome WebDriver"""
+    # ChromeDriver path and browser are created once and reused across extractions
+    _driver_path = None
+    _driver = None
+    _driver_lock = threading.Lock()
+    
+    @classmethod
+    def get_driver(cls):
+        """Return the shared Chrome WebDriver, starting it if needed (call with _driver_lock held)"""
+        if cls._driver is not None:
+            if cls._driver.service.is_connectable():
+                return cls._driver
+            cls.close_driver()
+        
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'--user-agent={_BROWSER_USER_AGENT}')
         
         # Add more options for stability
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
@@ -413,18 +578,39 @@ class StreamInfoExtractor:
         }
         chrome_options.add_experimental_option("prefs", prefs)
         
-        # Use webdriver-manager to automatically download and manage ChromeDriver
-        service = Service(ChromeDriverManager().install())
+        # Use webdriver-manager to download ChromeDriver once per process
+        if cls._driver_path is None:
+            cls._driver_path = ChromeDriverManager().install()
+        service = Service(cls._driver_path)
         driver = webdriver.Chrome(service=service, options=chrome_options)
         
         # Execute script to remove webdriver property
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+        cls._driver = driver
         return driver
     
+    @classmethod
+    def close_driver(cls):
+        """Quit the shared Chrome WebDriver, if one is running"""
+        driver, cls._driver = cls._driver, None
+        if driver:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+    
     @staticmethod
     def extract_with_fallback(url):
-        """Try Selenium first, then fall back to manual instructions if it fails"""
+        """Try a plain page fetch, then Selenium, then fall back to manual instructions"""
+        try:
+            # Most pages carry the <time> element in the served HTML
+            result = StreamInfoExtractor._extract_from_streamscharts_http(url)
+            if result:
+                return result
+        except Exception:
+            pass
+        
         try:
             # Try with Selenium
             result = StreamInfoExtractor.extract_from_url(url)
@@ -442,7 +628,7 @@ class StreamInfoExtractor:
         
         # Try to extract from URL patterns
         if 'streamscharts.com' in domain:
-            match = re.search(r'/channels/([^/]+)/streams/(\d+)', url)
+            match = _STREAMSCHARTS_URL_RE.search(url)
             if match:
                 streamer = match.group(1).lower()
                 vod_id = match.group(2)
@@ -457,16 +643,8 @@ class StreamInfoExtractor:
     @staticmethod
     def extract_vod_id_from_url(url):
         """Try to extract just the VOD ID from various URL formats"""
-        patterns = [
-            r'/streams/(\d{10,})',
-            r'/stream/(\d{10,})',
-            r'/(\d{10,})/?$',
-            r'[?&]v=(\d{10,})',
-            r'/videos/(\d{10,})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in _VOD_ID_RES:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         
@@ -491,34 +669,65 @@ class StreamInfoExtractor:
                 "3. Enter timestamp as: YYYY-MM-DD HH:MM:SS"
             )
     
-    @staticmethod
-    def extract_from_url(url):
+    @classmethod
+    def extract_from_url(cls, url):
         """Extract streamer name, VOD ID, and timestamp from tracking site URLs"""
-        driver = None
-        try:
-            parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
-            
-            # Create driver
-            driver = StreamInfoExtractor.get_driver()
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc.lower()
+        
+        if 'streamscharts.com' not in domain:
+            return None, None, None, "Unsupported website. Supported site: Streamscharts"
+        
+        with cls._driver_lock:
+            try:
+                driver = cls.get_driver()
+                try:
+                    return cls._extract_from_streamscharts(url, driver)
+                finally:
+                    # Reset the browser for the next extraction instead of quitting it
+                    driver.delete_all_cookies()
+                    driver.get('about:blank')
             
-            if 'streamscharts.com' in domain:
-                return StreamInfoExtractor._extract_from_streamscharts(url, driver)
-            else:
-                return None, None, None, "Unsupported website. Supported site: Streamscharts"
+            except Exception as e:
+                # Don't hand a browser in an unknown state to the next extraction
+                cls.close_driver()
+                return None, None, None, f"Error extracting info: {str(e)}"
+    
+    @staticmethod
+    def _extract_from_streamscharts_http(url):
+        """Read the Streamscharts timestamp from the page HTML without a browser
         
-        except Exception as e:
-            return None, None, None, f"Error extracting info: {str(e)}"
-        finally:
-            if driver:
-                driver.quit()
+        Returns None when the page has to be rendered (e.g. a Cloudflare challenge),
+        so the caller can fall back to Selenium.
+        """
+        if 'streamscharts.com' not in urlparse(url).netloc.lower():
+            return None
+        
+        match = _STREAMSCHARTS_URL_RE.search(url)
+        if not match:
+            return None
+        
+        response = requests.get(url, headers={'User-Agent': _BROWSER_USER_AGENT}, timeout=10)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, _HTML_PARSER, parse_only=_TIME_ELEMENTS)
+        
+        for element in soup.find_all('time'):
+            datetime_attr = element.get('datetime')
+            parsed = datetime_attr and StreamInfoExtractor._parse_streamscharts_date(datetime_attr)
+            if not parsed:
+                text = element.get_text(strip=True)
+                parsed = text and DateParser.parse_various_formats(text)
+            if parsed:
+                return match.group(1).lower(), match.group(2), parsed, None
+        
+        return None
     
     @staticmethod
     def _extract_from_streamscharts(url, driver):
         """Extract info from Streamscharts URL using Selenium"""
         try:
             # Extract from URL first
-            match = re.search(r'/channels/([^/]+)/streams/(\d+)', url)
+            match = _STREAMSCHARTS_URL_RE.search(url)
             if not match:
                 return None, None, None, "Invalid Streamscharts URL format"
             
@@ -590,19 +799,15 @@ class StreamInfoExtractor:
             # Clean the string
             date_str = date_str.strip()
             
-            # Pattern 1: DD-MM-YYYY HH:MM format
-            if re.match(r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}', date_str):
-                dt = datetime.strptime(date_str, "%d-%m-%Y %H:%M")
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Pattern 2: DD-MM-YYYY HH:MM:SS format
-            if re.match(r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}', date_str):
-                dt = datetime.strptime(date_str, "%d-%m-%Y %H:%M:%S")
+            # Pattern 1: DD-MM-YYYY HH:MM or DD-MM-YYYY HH:MM:SS format
+            match = _STREAMSCHARTS_DMY_RE.match(date_str)
+            if match:
+                fmt = "%d-%m-%Y %H:%M:%S" if match.group(1) else "%d-%m-%Y %H:%M"
+                dt = datetime.strptime(date_str, fmt)
                 return dt.strftime("%Y-%m-%d %H:%M:%S")
             
-            # Pattern 3: "25 May 2025, 18:55" format
-            pattern = r'(\d{1,2})\s+(\w+)\s+(\d{4}),?\s+(\d{2}):(\d{2})'
-            match = re.search(pattern, date_str)
+            # Pattern 2: "25 May 2025, 18:55" format
+            match = _STREAMSCHARTS_DAY_MONTH_RE.search(date_str)
             if match:
                 day = int(match.group(1))
                 month_name = match.group(2)
@@ -621,6 +826,9 @@ class StreamInfoExtractor:
         # Fall back to general parsing
         return DateParser.parse_various_formats(date_str)
 
+# Don't leave a headless Chrome behind when the app exits
+atexit.register(StreamInfoExtractor.close_driver)
+
 class FastM3U8DownloadThread(QThread):
     """Fast M3U8 downloader with parallel segment downloading and pause/resume functionality"""
     
@@ -628,28 +836,82 @@ class FastM3U8DownloadThread(QThread):
     progress_value = Signal(int)
     download_finished = Signal(bool, str)
     speed_update = Signal(str)
+    path_ready = Signal(str)
     
-    def __init__(self, url, output_path, start_time=None, duration=None, max_workers=8, chunk_size=1024*1024):
+    # Minimum seconds between progress/speed signals
+    PROGRESS_INTERVAL = 0.1
+    # Weight of the newest sample in the reported download speed
+    SPEED_SMOOTHING = 0.3
+    # Attempts per segment, and the backoff range (seconds) between them
+    SEGMENT_ATTEMPTS = 5
+    RETRY_BACKOFF_BASE = 0.5
+    RETRY_BACKOFF_CAP = 30
+    # (connect, read) timeouts for segment requests; short enough that a
+    # stalled fetch notices stop/abort quickly instead of blocking shutdown
+    SEGMENT_TIMEOUT = (3, 10)
+    # Seconds of throughput measured before the parallel download limit is adjusted,
+    # and the relative change that counts as better or worse
+    AUTOSCALE_INTERVAL = 5.0
+    AUTOSCALE_THRESHOLD = 0.1
+    
+    def __init__(self, url, streamer_name, start_time=None, duration=None, max_workers=8, chunk_size=1024*1024):
         super().__init__()
         self.url = url
-        self.output_path = output_path
+        self.streamer_name = streamer_name
+        # Resolved in run() so directory creation stays off the GUI thread
+        self.output_path = None
         self.start_time = start_time
         self.duration = duration
         self.max_workers = max_workers
         self.chunk_size = chunk_size
-        self._should_stop = False
-        self._should_abort = False
+        self._stop_event = threading.Event()
+        self._abort_event = threading.Event()
         self._is_paused = False
         self.temp_dir = None
         self.partial_output_path = None
+        # Seconds between the first kept segment's start and the requested start
+        self.trim_lead_in = 0.0
         self.downloaded_segments = 0
         self.total_segments = 0
-        self.download_queue = queue.Queue()
         self.completed_segments = {}
         self.failed_segments = set()
         self.download_lock = threading.Lock()
-        self.start_time_download = None
         self.total_bytes_downloaded = 0
+        self._last_progress_emit = 0.0
+        self._last_progress_value = -1
+        self._bytes_at_last_emit = 0
+        self._speed_mbps = None
+        self._transform_count = 0
+        self._executor = None
+        # Responses being read, for stop/abort to close; separate from
+        # download_lock so fetch start/end never waits on progress reporting
+        self._active_responses = set()
+        self._responses_lock = threading.Lock()
+        
+        # Adaptive limit on concurrent segment fetches; max_workers is the ceiling
+        self._fetch_slots = threading.Condition()
+        self._fetch_limit = max_workers
+        self._fetches_in_flight = 0
+        self._scale_step = 1  # Starts at the ceiling, so only a drop moves it
+        self._scale_window_start = 0.0
+        self._scale_window_bytes = 0
+        self._last_window_throughput = None
+        
+        # Playlist fetch goes through requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers * 2, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Segments go straight through one keep-alive urllib3 pool shared by all
+        # workers, skipping the per-request overhead of requests; download_segment
+        # already retries with backoff, so urllib3 only follows redirects
+        self.http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=max_workers,
+            retries=urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=3),
+            timeout=urllib3.Timeout(connect=self.SEGMENT_TIMEOUT[0], read=self.SEGMENT_TIMEOUT[1])
+        )
         
         # Pause/resume synchronization
         self.pause_mutex = QMutex()
@@ -657,14 +919,14 @@ class FastM3U8DownloadThread(QThread):
     
     def stop(self):
         """Stop download but save what's been downloaded"""
-        self._should_stop = True
+        self._stop_event.set()
         self._force_stop_workers()
         self.resume()  # Wake up if paused
     
     def abort(self):
         """Abort download and delete partial files"""
-        self._should_abort = True
-        self._should_stop = True
+        self._abort_event.set()
+        self._stop_event.set()
         self._force_stop_workers()
         self.resume()  # Wake up if paused
     
@@ -673,12 +935,20 @@ class FastM3U8DownloadThread(QThread):
         # Signal all workers to stop
         self.progress_update.emit("🛑 Forcing all workers to stop...")
         
-        # Clear the download queue to prevent new tasks
-        try:
-            while not self.download_queue.empty():
-                self.download_queue.get_nowait()
-        except:
-            pass
+        # Drop every segment that hasn't started yet
+        executor = self._executor
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Cut off the transfers that are in flight; the socket shutdown makes
+        # each worker's blocked read return at once
+        with self._responses_lock:
+            responses = list(self._active_responses)
+        for response in responses:
+            try:
+                _interrupt_response(response)
+            except Exception:
+                pass
     
     def pause(self):
         """Pause the download"""
@@ -693,7 +963,7 @@ class FastM3U8DownloadThread(QThread):
         self._is_paused = False
         self.pause_condition.wakeAll()
         self.pause_mutex.unlock()
-        if not self._should_stop and not self._should_abort:
+        if not self._stop_event.is_set():
             self.progress_update.emit("▶️ Download resumed")
     
     def is_paused(self):
@@ -703,49 +973,60 @@ class FastM3U8DownloadThread(QThread):
     def _check_pause(self):
         """Check if paused and wait if necessary"""
         self.pause_mutex.lock()
-        while self._is_paused and not self._should_stop and not self._should_abort:
+        while self._is_paused and not self._stop_event.is_set():
             self.pause_condition.wait(self.pause_mutex)
         self.pause_mutex.unlock()
     
     def transform_url(self, url):
         """Transform unmuted.ts URLs to muted.ts"""
-        if url.endswith('-unmuted.ts'):
-            transformed_url = url.replace('-unmuted.ts', '-muted.ts')
-            if not hasattr(self, '_transform_count'):
-                self._transform_count = 0
+        if url.endswith(_UNMUTED_SUFFIX):
+            transformed_url = url[:-len(_UNMUTED_SUFFIX)] + _MUTED_SUFFIX
             self._transform_count += 1
             if self._transform_count <= 3:
-                self.progress_update.emit(f"🔄 Transformed: {url.split('/')[-1]} → {transformed_url.split('/')[-1]}")
+                self.progress_update.emit(f"🔄 Transformed: {url.rpartition('/')[2]} → {transformed_url.rpartition('/')[2]}")
             elif self._transform_count == 4:
                 self.progress_update.emit("🔄 (Further URL transformations will be silent)")
             return transformed_url
         return url
     
     def parse_m3u8(self, m3u8_url):
-        """Parse M3U8 file and extract segment URLs and durations"""
+        """Parse M3U8 file and extract segment URLs and durations (as an array of doubles)"""
         try:
             if m3u8_url.startswith("http"):
-                response = requests.get(m3u8_url, timeout=10)
+                response = self.session.get(m3u8_url, timeout=10)
                 response.raise_for_status()
-                lines = response.text.splitlines()
+                playlist = response.content
                 base_url = m3u8_url.rsplit('/', 1)[0] + '/'
             else:
-                with open(m3u8_url, "r") as f:
-                    lines = f.read().splitlines()
+                with open(m3u8_url, "rb") as f:
+                    playlist = f.read()
                 base_url = "file://" + os.path.dirname(os.path.abspath(m3u8_url)) + "/"
             
+            # Whole-playlist regex pass over the bytes; only the URIs get decoded
+            # (playlists are UTF-8). The line scan below is only a fallback
+            pairs = _EXTINF_SEGMENT_RE.findall(playlist)
+            if pairs:
+                segment_durations = array('d', (float(duration) for duration, _ in pairs))
+                segment_urls = []
+                for _, uri in pairs:
+                    uri = uri.decode('utf-8')
+                    segment_urls.append(self.transform_url(uri if uri.startswith("http") else urljoin(base_url, uri)))
+                return segment_urls, segment_durations
+            
             segment_urls = []
-            segment_durations = []
+            segment_durations = array('d')
             duration = None
             
-            for line in lines:
+            # Single pass over the raw lines; only segment URIs are decoded
+            for line in playlist.split(b"\n"):
                 line = line.strip()
-                if line.startswith("#EXTINF:"):
+                if line.startswith(b"#EXTINF:"):
                     try:
-                        duration = float(line.split(":")[1].split(",")[0])
-                    except:
+                        duration = float(line[8:].split(b",", 1)[0])
+                    except ValueError:
                         duration = None
-                elif line and not line.startswith("#"):
+                elif line and not line.startswith(b"#"):
+                    line = line.decode('utf-8', errors='replace')
                     if line.startswith("http"):
                         segment_url = line
                     else:
@@ -764,95 +1045,165 @@ class FastM3U8DownloadThread(QThread):
 
     def trim_segments(self, segment_urls, segment_durations, start_sec, end_sec):
         """Get segments for a specific time range"""
-        current_time = 0
-        start_idx = 0
-        end_idx = len(segment_urls)
+        # offsets[i] is the start time of segment i, offsets[i + 1] its end
+        offsets = array('d', accumulate(segment_durations, initial=0))
+        count = len(segment_urls)
         
-        for i, dur in enumerate(segment_durations):
-            if current_time + dur > start_sec:
-                start_idx = i
-                break
-            current_time += dur
+        # First segment that ends after start_sec, first one starting at or after end_sec
+        start_idx = bisect_right(offsets, start_sec, 1, count + 1) - 1
+        end_idx = bisect_left(offsets, end_sec, 0, count)
         
-        current_time = 0
-        for i, dur in enumerate(segment_durations):
-            if current_time >= end_sec:
-                end_idx = i
-                break
-            current_time += dur
+        # Whole segments are downloaded; the final concat cuts off this lead-in
+        self.trim_lead_in = max(0.0, start_sec - offsets[start_idx])
         
         return segment_urls[start_idx:end_idx], segment_durations[start_idx:end_idx]
     
+    def _fetch_segment(self, url, segment_path):
+        """Download one segment body to segment_path and return its size"""
+        # Copy the body straight to disk in large reads; pause is honoured
+        # between attempts, and stop shuts the socket down to end the copy early
+        response = self.http.request('GET', url, preload_content=False)
+        with self._responses_lock:
+            self._active_responses.add(response)
+        try:
+            # Anything but a full body (e.g. an unfollowed redirect) is not segment data
+            if response.status != 200:
+                raise urllib3.exceptions.HTTPError(f"HTTP {response.status} for {url}")
+            # Write under a .part name so an interrupted copy never looks complete
+            part_path = segment_path + '.part'
+            with open(part_path, 'wb') as file_handle:
+                shutil.copyfileobj(response, file_handle, length=self.chunk_size)
+                segment_bytes = file_handle.tell()
+            # A shut-down socket can read as a clean end of body; never keep that
+            if self._stop_event.is_set():
+                raise urllib3.exceptions.HTTPError("Download stopped mid-segment")
+            os.replace(part_path, segment_path)
+            return segment_bytes
+        finally:
+            with self._responses_lock:
+                self._active_responses.discard(response)
+            response.release_conn()
+    
     def download_segment(self, url, segment_index, temp_dir):
-        """Download a single segment"""
-        segment_path = None
-        file_handle = None
+        """Download a single segment, retrying with backoff"""
+        segment_path = os.path.join(temp_dir, f"segment_{segment_index:06d}.ts")
         
-        try:
+        for attempt in range(self.SEGMENT_ATTEMPTS):
             self._check_pause()
             
-            if self._should_stop or self._should_abort:
+            if self._stop_event.is_set():
                 return False
             
-            response = requests.get(url, timeout=30, stream=True)
-            response.raise_for_status()
-            
-            segment_path = os.path.join(temp_dir, f"segment_{segment_index:06d}.ts")
-            
-            file_handle = open(segment_path, 'wb')
-            
-            for chunk in response.iter_content(chunk_size=self.chunk_size):
-                if self._should_stop or self._should_abort:
-                    # Close file handle immediately on stop/abort
-                    if file_handle:
-                        file_handle.close()
-                        file_handle = None
+            try:
+                with self._fetch_slot():
+                    segment_bytes = self._fetch_segment(url, segment_path)
+                break
+            except Exception as e:
+                error = e
+                # Exponential backoff with full jitter so failing workers don't
+                # hit the CDN again in lockstep; a stop cuts the wait short
+                delay = random.uniform(0, min(self.RETRY_BACKOFF_CAP, self.RETRY_BACKOFF_BASE * 2 ** attempt))
+                if attempt + 1 < self.SEGMENT_ATTEMPTS and self._stop_event.wait(delay):
                     return False
-                
-                self._check_pause()
-                
-                if chunk:
-                    file_handle.write(chunk)
-                    with self.download_lock:
-                        self.total_bytes_downloaded += len(chunk)
-            
-            # Close file handle before updating completed segments
-            if file_handle:
-                file_handle.close()
-                file_handle = None
+        else:
+            if self._stop_event.is_set():
+                return False
             
             with self.download_lock:
-                self.completed_segments[segment_index] = segment_path
-                self.downloaded_segments += 1
-                progress = int((self.downloaded_segments / self.total_segments) * 100)
-                self.progress_value.emit(progress)
-                
-                if self.start_time_download:
-                    elapsed = time.time() - self.start_time_download
-                    if elapsed > 0:
-                        speed_mbps = (self.total_bytes_downloaded / (1024 * 1024)) / elapsed
-                        self.speed_update.emit(f"{speed_mbps:.2f} MB/s")
+                self.failed_segments.add(segment_index)
             
-            return True
+            self.progress_update.emit(f"❌ Failed to download segment {segment_index}: {str(error)}")
+            return False
         
-        except Exception as e:
-            # Ensure file handle is closed on error
-            if file_handle:
-                try:
-                    file_handle.close()
-                except:
-                    pass
+        with self.download_lock:
+            self.total_bytes_downloaded += segment_bytes
+            self.completed_segments[segment_index] = segment_path
+            self.downloaded_segments += 1
             
-            with self.download_lock:
-                self.failed_segments.add(segment_index)
+            # Keep cross-thread signals to a few per second; always report the last segment
+            now = time.monotonic()
+            if (now - self._last_progress_emit < self.PROGRESS_INTERVAL
+                    and self.downloaded_segments < self.total_segments):
+                return True
+            interval = now - self._last_progress_emit
+            self._last_progress_emit = now
             
-            self.progress_update.emit(f"❌ Failed to download segment {segment_index}: {str(e)}")
-            return False
+            # The bar only moves in whole percent, so skip repeats of the same value
+            progress = int((self.downloaded_segments / self.total_segments) * 100)
+            if progress != self._last_progress_value:
+                self._last_progress_value = progress
+                self.progress_value.emit(progress)
+            
+            # Smoothed recent speed rather than the average over the whole download
+            if interval > 0:
+                recent_bytes = self.total_bytes_downloaded - self._bytes_at_last_emit
+                self._bytes_at_last_emit = self.total_bytes_downloaded
+                instant_mbps = recent_bytes / (1024 * 1024) / interval
+                if self._speed_mbps is None:
+                    self._speed_mbps = instant_mbps
+                else:
+                    self._speed_mbps += self.SPEED_SMOOTHING * (instant_mbps - self._speed_mbps)
+                self.speed_update.emit(f"{self._speed_mbps:.2f} MB/s")
+            
+            self._autoscale(now)
+        
+        return True
+    
+    @contextmanager
+    def _fetch_slot(self):
+        """Hold one of the current _fetch_limit slots for a segment fetch"""
+        with self._fetch_slots:
+            while self._fetches_in_flight >= self._fetch_limit and not self._stop_event.is_set():
+                self._fetch_slots.wait(0.5)
+            self._fetches_in_flight += 1
+        try:
+            yield
+        finally:
+            with self._fetch_slots:
+                self._fetches_in_flight -= 1
+                self._fetch_slots.notify()
+    
+    def _autoscale(self, now):
+        """Hill-climb the parallel fetch limit on measured throughput (call with download_lock held)
+        
+        The first window only measures a baseline. After that a clearly worse
+        window reverses the direction and steps, a clearly better one keeps
+        stepping the same way, and a flat one holds the limit where it is.
+        """
+        elapsed = now - self._scale_window_start
+        if elapsed < self.AUTOSCALE_INTERVAL:
+            return
+        
+        throughput = (self.total_bytes_downloaded - self._scale_window_bytes) / elapsed
+        self._scale_window_start = now
+        self._scale_window_bytes = self.total_bytes_downloaded
+        previous, self._last_window_throughput = self._last_window_throughput, throughput
+        
+        if previous is None:
+            return
+        
+        change = (throughput - previous) / previous if previous else 0
+        if change < -self.AUTOSCALE_THRESHOLD:
+            self._scale_step = -self._scale_step
+        elif change < self.AUTOSCALE_THRESHOLD:
+            return
+        
+        limit = min(self.max_workers, max(1, self._fetch_limit + self._scale_step))
+        if limit == self._fetch_limit:
+            # Already at the floor or the ceiling; wait for a drop to turn around
+            return
+        
+        with self._fetch_slots:
+            self._fetch_limit = limit
+            self._fetch_slots.notify_all()
+        self.progress_update.emit(f"⚙️ Adjusted to {limit} parallel downloads")
     
     def run(self):
         """Main download thread execution"""
         try:
-            self.start_time_download = time.time()
+            if not self._prepare_output_path():
+                return
+            
             self.progress_update.emit("📋 Parsing M3U8 file...")
             
             segment_urls, segment_durations = self.parse_m3u8(self.url)
@@ -880,75 +1231,32 @@ class FastM3U8DownloadThread(QThread):
             self.progress_update.emit(f"📁 Created temp directory: {self.temp_dir}")
             
             self.progress_update.emit(f"⚡ Starting parallel download with {self.max_workers} workers...")
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_index = {
-                    executor.submit(self.download_segment, url, i, self.temp_dir): i
+            self._last_progress_emit = self._scale_window_start = time.monotonic()
+            
+            # Workers record their own results and leaving the with block waits for
+            # them. This thread counts as one of the workers, so the pool gets one less
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers - 1)) as executor:
+                self._executor = executor
+                futures = [
+                    executor.submit(self.download_segment, url, i, self.temp_dir)
                     for i, url in enumerate(segment_urls)
-                }
+                ]
                 
-                for future in as_completed(future_to_index):
-                    if self._should_stop or self._should_abort:
-                        # Cancel all remaining futures immediately
-                        self.progress_update.emit("🛑 Cancelling remaining downloads...")
-                        for f in future_to_index:
-                            if not f.done():
-                                f.cancel()
-                        # Force shutdown of executor
-                        executor.shutdown(wait=False)
+                # Take segments from the back of the queue until we meet the pool;
+                # any future that can still be cancelled hasn't started yet
+                for segment_index in reversed(range(len(futures))):
+                    if self._stop_event.is_set() or not futures[segment_index].cancel():
                         break
-                    
-                    segment_index = future_to_index[future]
-                    try:
-                        success = future.result(timeout=1)  # Add timeout to prevent hanging
-                        if not success and segment_index not in self.failed_segments:
-                            self.failed_segments.add(segment_index)
-                    except Exception as e:
-                        self.failed_segments.add(segment_index)
-                        self.progress_update.emit(f"❌ Error downloading segment {segment_index}: {str(e)}")
+                    self.download_segment(segment_urls[segment_index], segment_index, self.temp_dir)
             
-            if self._should_abort:
+            if self._abort_event.is_set():
                 self.progress_update.emit("⏹️ Download aborted by user")
                 self._cleanup_temp_files()
                 self.download_finished.emit(False, "Download aborted by user")
                 return
             
-            # Retry failed segments
-            if self.failed_segments and not self._should_stop:
-                self.progress_update.emit(f"🔄 Retrying {len(self.failed_segments)} failed segments...")
-                retry_count = 0
-                max_retries = 3
-                
-                while self.failed_segments and retry_count < max_retries and not self._should_stop and not self._should_abort:
-                    retry_count += 1
-                    failed_copy = self.failed_segments.copy()
-                    self.failed_segments.clear()
-                    
-                    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(failed_copy))) as executor:
-                        retry_futures = {
-                            executor.submit(self.download_segment, segment_urls[i], i, self.temp_dir): i
-                            for i in failed_copy
-                        }
-                        
-                        for future in as_completed(retry_futures):
-                            if self._should_stop or self._should_abort:
-                                # Cancel all remaining retry futures
-                                for f in retry_futures:
-                                    if not f.done():
-                                        f.cancel()
-                                executor.shutdown(wait=False)
-                                break
-                            
-                            segment_index = retry_futures[future]
-                            try:
-                                success = future.result(timeout=1)
-                                if not success:
-                                    self.failed_segments.add(segment_index)
-                            except Exception:
-                                self.failed_segments.add(segment_index)
-            
             # Concatenate segments
-            if not self._should_stop and not self._should_abort:
+            if not self._stop_event.is_set():
                 self.progress_update.emit("🔗 Concatenating segments...")
                 success = self._concatenate_segments()
                 
@@ -982,29 +1290,50 @@ class FastM3U8DownloadThread(QThread):
         finally:
             # Ensure cleanup happens even if there's an exception
             self._cleanup_temp_files()
+            self.session.close()
+            self.http.clear()
+    
+    def _prepare_output_path(self):
+        """Create Output/<streamer>/VODs and choose the output file name"""
+        # Create output directory structure: Output/streamername/VODs
+        output_dir = os.path.join("Output", FileNamingUtils.sanitize_filename(self.streamer_name), "VODs")
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except Exception as e:
+            self.download_finished.emit(False, f"Failed to create output directory: {str(e)}")
+            return False
+        
+        self.output_path = os.path.join(output_dir, FileNamingUtils.generate_m3u8_vod_name(self.streamer_name))
+        self.path_ready.emit(self.output_path)
+        return True
     
     def _concatenate_segments(self):
         """Concatenate downloaded segments into final video file"""
         try:
-            segment_files = []
-            for i in range(self.total_segments):
-                if i in self.completed_segments:
-                    segment_files.append(self.completed_segments[i])
-            
-            if not segment_files:
+            if not self.completed_segments:
                 return False
             
+            # Segments all live in temp_dir, so resolve and escape that prefix once;
+            # segment file names never need escaping
+            temp_dir = os.path.abspath(self.temp_dir).replace('\\', '/').replace("'", "\\'")
+            concat_list = "".join(
+                f"file '{temp_dir}/{os.path.basename(self.completed_segments[i])}'\n"
+                for i in sorted(self.completed_segments)
+            )
+            
             concat_file = os.path.join(self.temp_dir, "concat_list.txt")
             with open(concat_file, 'w', encoding='utf-8') as f:
-                for segment_file in segment_files:
-                    abs_path = os.path.abspath(segment_file)
-                    ffmpeg_path = abs_path.replace('\\', '/').replace("'", "\\'")
-                    f.write(f"file '{ffmpeg_path}'\n")
-            
-            cmd = [
-                'ffmpeg', '-y', '-f', 'concat', '-safe', '0',
-                '-i', concat_file, '-c', 'copy', self.output_path
-            ]
+                f.write(concat_list)
+            
+            cmd = ['ffmpeg', '-y', '-f', 'concat', '-safe', '0']
+            # Cut down to the requested range inside the first and last segments;
+            # the lead-in only applies when the first segment was downloaded
+            if self.trim_lead_in > 0 and 0 in self.completed_segments:
+                cmd += ['-ss', f"{self.trim_lead_in:.3f}"]
+            cmd += ['-i', concat_file]
+            if self.duration:
+                cmd += ['-t', f"{self.duration:.3f}"]
+            cmd += ['-c', 'copy', self.output_path]
             
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
             
@@ -1026,47 +1355,41 @@ class FastM3U8DownloadThread(QThread):
         try:
             self.progress_update.emit("🧹 Cleaning up temporary files...")
             
-            # Remove all files in temp directory
-            for filename in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, filename)
-                try:
-                    if os.path.isfile(file_path):
-                        # Make file writable before deletion (Windows compatibility)
-                        os.chmod(file_path, stat.S_IWRITE)
-                        os.remove(file_path)
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)
-                except Exception as e:
-                    self.progress_update.emit(f"⚠️ Could not delete {filename}: {str(e)}")
-            
-            # Remove temp directory
-            try:
-                os.rmdir(self.temp_dir)
-                self.progress_update.emit("✅ Temporary files cleaned up")
-            except Exception as e:
-                self.progress_update.emit(f"⚠️ Could not remove temp directory: {str(e)}")
+            shutil.rmtree(self.temp_dir, onerror=_remove_readonly)
+            self.progress_update.emit("✅ Temporary files cleaned up")
         
         except Exception as e:
             self.progress_update.emit(f"⚠️ Error during cleanup: {str(e)}")
 
-class StreamInfoExtractionThread(QThread):
-    """Thread for extracting stream information from tracking websites"""
+class StreamInfoExtractionSignals(QObject):
+    """Signals emitted by StreamInfoExtractionTask"""
     
     progress_update = Signal(str)
     extraction_finished = Signal(str, str, str, str)  # streamer, vod_id, timestamp, error
+    finished = Signal()  # Always last, including after a stop
+
+class StreamInfoExtractionTask(QRunnable):
+    """Pooled job for extracting stream information from tracking websites"""
     
     def __init__(self, url):
         super().__init__()
+        self.setAutoDelete(False)
+        self.signals = StreamInfoExtractionSignals()
         self.url = url
         self._should_stop = False
+        self._running = threading.Event()
     
     def stop(self):
         self._should_stop = True
     
+    def is_running(self):
+        return self._running.is_set()
+    
     def run(self):
         """Run the stream info extraction"""
+        self._running.set()
         try:
-            self.progress_update.emit("🔍 Extracting stream information...")
+            self.signals.progress_update.emit("🔍 Extracting stream information...")
             
             if self._should_stop:
                 return
@@ -1074,21 +1397,40 @@ class StreamInfoExtractionThread(QThread):
             streamer, vod_id, timestamp, error = StreamInfoExtractor.extract_with_fallback(self.url)
             
             if not self._should_stop:
-                self.extraction_finished.emit(streamer or "", vod_id or "", timestamp or "", error or "")
+                self.signals.extraction_finished.emit(streamer or "", vod_id or "", timestamp or "", error or "")
         
         except Exception as e:
             if not self._should_stop:
-                self.extraction_finished.emit("", "", "", f"Error extracting info: {str(e)}")
+                self.signals.extraction_finished.emit("", "", "", f"Error extracting info: {str(e)}")
+        finally:
+            self._running.clear()
+            self.signals.finished.emit()
 
 class M3U8Downloader(QWidget):
+    # Log lines are queued and flushed to the console on a timer; the queue and
+    # the console both keep only the most recent lines
+    LOG_FLUSH_INTERVAL_MS = 100
+    LOG_QUEUE_LIMIT = 5000
+    CONSOLE_MAX_LINES = 5000
+    # Seconds a VOD search result (found URL or confirmed miss) is reused
+    PROBE_CACHE_TTL = 600
+    
     def __init__(self, config):
         super().__init__()
         self.config = config
-        self.vod_finder_thread = None
+        self.vod_finder_task = None
+        # (streamer, vod_id, timestamp) -> (expiry, url or None)
+        self._probe_cache = {}
+        self._probe_key = None
         self.download_thread = None
-        self.extraction_thread = None
+        self.extraction_task = None
         self.detected_streamer = None
         
+        self._log_queue = deque(maxlen=self.LOG_QUEUE_LIMIT)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         self.setStyleSheet("""
             QWidget {
                 background-color: #2b2b2b;
@@ -1371,6 +1713,7 @@ class M3U8Downloader(QWidget):
         self.console_output.setStyleSheet(StyleManager.console_style())
         self.console_output.setReadOnly(True)
         self.console_output.setMaximumHeight(200)
+        self.console_output.document().setMaximumBlockCount(self.CONSOLE_MAX_LINES)
         console_layout.addWidget(self.console_output)
         
         # Add all groups to content layout
@@ -1445,15 +1788,24 @@ class M3U8Downloader(QWidget):
         """Add message to console with timestamp"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
-        self.console_output.append(formatted_message)
+        self._log_queue.append(formatted_message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_log(self):
+        """Append all queued log lines to the console in one update"""
+        if not self._log_queue:
+            self._log_timer.stop()
+            return
+        
+        messages = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.console_output.append(messages)
         
         # Auto-scroll to bottom
         cursor = self.console_output.textCursor()
         cursor.movePosition(cursor.MoveOperation.End)
         self.console_output.setTextCursor(cursor)
-        
-        # Process events to update UI
-        QApplication.processEvents()
     
     def find_vod_m3u8(self):
         """Extract info from tracking URL and find VOD"""
@@ -1462,21 +1814,38 @@ class M3U8Downloader(QWidget):
             self.log_message("❌ Please enter a tracking website URL")
             return
         
-        # Disable button during extraction
+        if self.extraction_task is not None:
+            self.log_message("⚠️ The previous extraction is still running, please wait")
+            return
+        
+        # Disable button until the task reports finished
         self.find_button.setEnabled(False)
         self.find_button.setText("🔍 Extracting...")
         
-        # Start extraction thread
-        self.extraction_thread = StreamInfoExtractionThread(url)
-        self.extraction_thread.progress_update.connect(self.log_message)
-        self.extraction_thread.extraction_finished.connect(self.on_extraction_finished)
-        self.extraction_thread.start()
+        # Run the extraction on the shared thread pool
+        self.extraction_task = StreamInfoExtractionTask(url)
+        self.extraction_task.signals.progress_update.connect(self.log_message)
+        self.extraction_task.signals.extraction_finished.connect(self.on_extraction_finished)
+        self.extraction_task.signals.finished.connect(self.on_extraction_task_finished)
+        QThreadPool.globalInstance().start(self.extraction_task)
     
-    def on_extraction_finished(self, streamer, vod_id, timestamp, error):
-        """Handle extraction completion"""
-        # Re-enable button
+    def _from_current_task(self, task):
+        """False when the calling signal came from a task that is no longer current"""
+        sender = self.sender()
+        return sender is None or (task is not None and sender is task.signals)
+    
+    def on_extraction_task_finished(self):
+        """Release the extraction task and re-enable its button"""
+        if not self._from_current_task(self.extraction_task):
+            return
+        self.extraction_task = None
         self.find_button.setEnabled(True)
         self.find_button.setText("🔍 Extract Info")
+    
+    def on_extraction_finished(self, streamer, vod_id, timestamp, error):
+        """Handle extraction completion"""
+        if not self._from_current_task(self.extraction_task):
+            return
         
         if error:
             self.log_message(f"⚠️ {error}")
@@ -1512,18 +1881,33 @@ class M3U8Downloader(QWidget):
             self.log_message("❌ Please fill in streamer name, VOD ID, and timestamp")
             return
         
+        if self.vod_finder_task is not None:
+            self.log_message("⚠️ The previous VOD search is still running, please wait")
+            return
+        
         # Validate VOD ID
         if not vod_id.isdigit() or len(vod_id) < 10:
             self.log_message("❌ VOD ID should be a number with at least 10 digits")
             return
         
         # Validate timestamp format
-        try:
-            datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S")
-        except ValueError:
+        if not _TIMESTAMP_RE.fullmatch(timestamp):
             self.log_message("❌ Timestamp should be in format: YYYY-MM-DD HH:MM:SS")
             return
         
+        # Reuse a recent result for the same VOD instead of probing every domain again
+        key = (streamer, vod_id, timestamp)
+        cached = self._probe_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            self.log_message("♻️ Using cached search result")
+            self._probe_key = None
+            if cached[1]:
+                self.on_vod_found(cached[1])
+            else:
+                self.on_vod_error(VODFinderTask.NOT_FOUND_MESSAGE)
+            return
+        self._probe_key = key
+        
         # Disable buttons
         self.manual_find_button.setEnabled(False)
         self.manual_find_button.setText("🔍 Searching...")
@@ -1549,17 +1933,28 @@ class M3U8Downloader(QWidget):
             "https://vod-pop-secure.twitch.tv/"
         ]
         
-        # Start VOD finder thread
-        self.vod_finder_thread = VODFinderThread(streamer, vod_id, timestamp, domains)
-        self.vod_finder_thread.progress_update.connect(self.log_message)
-        self.vod_finder_thread.found_url.connect(self.on_vod_found)
-        self.vod_finder_thread.error.connect(self.on_vod_error)
-        self.vod_finder_thread.start()
+        # Run the VOD finder on the shared thread pool
+        self.vod_finder_task = VODFinderTask(streamer, vod_id, timestamp, domains)
+        self.vod_finder_task.signals.progress_update.connect(self.log_message)
+        self.vod_finder_task.signals.found_url.connect(self.on_vod_found)
+        self.vod_finder_task.signals.error.connect(self.on_vod_error)
+        self.vod_finder_task.signals.finished.connect(self.on_vod_finder_finished)
+        QThreadPool.globalInstance().start(self.vod_finder_task)
     
-    def on_vod_found(self, url):
-        """Handle successful VOD URL discovery"""
+    def on_vod_finder_finished(self):
+        """Release the VOD finder task and re-enable its button"""
+        if not self._from_current_task(self.vod_finder_task):
+            return
+        self.vod_finder_task = None
         self.manual_find_button.setEnabled(True)
         self.manual_find_button.setText("🔍 Find VOD")
+    
+    def on_vod_found(self, url):
+        """Handle successful VOD URL discovery"""
+        if not self._from_current_task(self.vod_finder_task):
+            return
+        
+        self._cache_probe_result(url)
         
         self.url_input.setText(url)
         self.log_message(f"✅ Found VOD URL: {url}")
@@ -1567,14 +1962,30 @@ class M3U8Downloader(QWidget):
     
     def on_vod_error(self, error_msg):
         """Handle VOD finder errors"""
-        self.manual_find_button.setEnabled(True)
-        self.manual_find_button.setText("🔍 Find VOD")
+        if not self._from_current_task(self.vod_finder_task):
+            return
+        
+        # Only a completed search that found nothing is worth remembering
+        task = self.vod_finder_task
+        if error_msg == VODFinderTask.NOT_FOUND_MESSAGE and task and not task.search_failed:
+            self._cache_probe_result(None)
         
         self.log_message(f"❌ {error_msg}")
         self.log_message("💡 Try adjusting the timestamp or check if the VOD is still available")
     
+    def _cache_probe_result(self, url):
+        """Remember the result of the search that was just run"""
+        if self._probe_key is not None:
+            self._probe_cache[self._probe_key] = (time.monotonic() + self.PROBE_CACHE_TTL, url)
+            self._probe_key = None
+    
     def start_download(self):
         """Start the M3U8 download"""
+        # Never replace a download thread that is still running
+        if self.download_thread and self.download_thread.isRunning():
+            self.log_message("⚠️ The previous download is still stopping, please wait")
+            return
+        
         url = self.url_input.text().strip()
         if not url:
             self.log_message("❌ Please enter an M3U8 URL")
@@ -1601,23 +2012,6 @@ class M3U8Downloader(QWidget):
         self.streamer_input.setText(streamer_name)
         self.detected_streamer = streamer_name
         
-        # Create output directory structure: Output/streamername/VODs
-        output_dir = os.path.join("Output", FileNamingUtils.sanitize_filename(streamer_name), "VODs")
-        
-        # Create the directory if it doesn't exist
-        try:
-            os.makedirs(output_dir, exist_ok=True)
-            self.log_message(f"📁 Created output directory: {output_dir}")
-        except Exception as e:
-            self.log_message(f"❌ Failed to create output directory: {str(e)}")
-            return
-        
-        # Generate filename using FileNamingUtils
-        default_filename = FileNamingUtils.generate_m3u8_vod_name(streamer_name)
-        
-        # Full path for the file - use this directly without dialog
-        output_path = os.path.join(output_dir, default_filename)
-        
         # Parse time inputs
         start_time_sec = None
         duration_sec = None
@@ -1652,27 +2046,32 @@ class M3U8Downloader(QWidget):
         self.pause_button.setEnabled(True)
         self.stop_button.setEnabled(True)
         
-        # Start download thread
+        # Start download thread; it creates the output directory and reports the path
         self.download_thread = FastM3U8DownloadThread(
-            url, output_path, start_time_sec, duration_sec, max_workers
+            url, streamer_name, start_time_sec, duration_sec, max_workers
         )
         
         self.download_thread.progress_update.connect(self.log_message)
         self.download_thread.progress_value.connect(self.progress_bar.setValue)
         self.download_thread.speed_update.connect(self.update_speed)
         self.download_thread.download_finished.connect(self.on_download_finished)
+        self.download_thread.path_ready.connect(self.on_output_path_ready)
+        self.download_thread.finished.connect(lambda: self.download_button.setEnabled(True))
         
         self.download_thread.start()
         
         self.log_message(f"🚀 Starting download with {max_workers} workers...")
         self.log_message(f"👤 Streamer: {streamer_name}")
-        self.log_message(f"📁 Output: {output_path}")
         
         if start_time_sec is not None:
             self.log_message(f"⏰ Start time: {TimeUtils.format_seconds(start_time_sec)}")
         if duration_sec is not None:
             self.log_message(f"⏱️ Duration: {TimeUtils.format_seconds(duration_sec)}")
     
+    def on_output_path_ready(self, output_path):
+        """Log the output file chosen by the download thread"""
+        self.log_message(f"📁 Output: {output_path}")
+    
     def pause_download(self):
         """Pause/resume the download"""
         if self.download_thread and self.download_thread.isRunning():
@@ -1691,16 +2090,16 @@ class M3U8Downloader(QWidget):
             self.download_thread.abort()
             
             # Update UI immediately
-            self.download_button.setEnabled(True)
             self.pause_button.setEnabled(False)
             self.pause_button.setText("⏸️ Pause")
             self.stop_button.setEnabled(False)
             
-            # Force thread to stop within reasonable time
-            if not self.download_thread.wait(5000):  # Wait 5 seconds
-                self.log_message("⚠️ Force terminating download thread...")
-                self.download_thread.terminate()
-                self.download_thread.wait(2000)  # Wait for termination
+            # Workers notice the abort between segments and within one socket timeout;
+            # Download stays disabled until the thread has actually finished
+            if self.download_thread.wait(5000):  # Wait 5 seconds
+                self.download_button.setEnabled(True)
+            else:
+                self.log_message("⚠️ Download thread is still finishing in the background...")
     
     def update_speed(self, speed_text):
         """Update speed display"""
@@ -1720,25 +2119,29 @@ class M3U8Downloader(QWidget):
         """Emergency stop all operations immediately"""
         self.log_message("🚨 EMERGENCY STOP - Terminating all operations...")
         
-        # Stop all threads immediately
-        if self.extraction_thread and self.extraction_thread.isRunning():
-            self.extraction_thread.terminate()
+        # Stop all threads immediately; pooled jobs can only be asked to stop
+        if self.extraction_task:
+            self.extraction_task.stop()
         
-        if self.vod_finder_thread and self.vod_finder_thread.isRunning():
-            self.vod_finder_thread.terminate()
+        if self.vod_finder_task:
+            self.vod_finder_task.stop()
         
-        if self.download_thread and self.download_thread.isRunning():
-            self.download_thread.terminate()
+        download_running = bool(self.download_thread and self.download_thread.isRunning())
+        if download_running:
+            self.download_thread.abort()
         
-        # Reset UI
-        self.download_button.setEnabled(True)
+        # Reset UI; Download is re-enabled when the aborted thread finishes
+        self.download_button.setEnabled(not download_running)
         self.pause_button.setEnabled(False)
         self.pause_button.setText("⏸️ Pause")
         self.stop_button.setEnabled(False)
-        self.find_button.setEnabled(True)
-        self.find_button.setText("🔍 Extract Info")
-        self.manual_find_button.setEnabled(True)
-        self.manual_find_button.setText("🔍 Find VOD")
+        # Find buttons come back from the tasks' finished handlers
+        if self.extraction_task is None:
+            self.find_button.setEnabled(True)
+            self.find_button.setText("🔍 Extract Info")
+        if self.vod_finder_task is None:
+            self.manual_find_button.setEnabled(True)
+            self.manual_find_button.setText("🔍 Find VOD")
         
         self.log_message("🚨 Emergency stop completed")
     
@@ -1776,23 +2179,21 @@ class M3U8Downloader(QWidget):
         """Handle widget close event - ensure all threads are stopped"""
         self.log_message("🔄 Shutting down M3U8 Downloader...")
         
-        # Stop extraction thread
-        if self.extraction_thread and self.extraction_thread.isRunning():
-            self.log_message("⏹️ Stopping extraction thread...")
-            self.extraction_thread.stop()
-            if not self.extraction_thread.wait(2000):
-                self.log_message("⚠️ Extraction thread did not stop gracefully, terminating...")
-                self.extraction_thread.terminate()
-                self.extraction_thread.wait(1000)
-        
-        # Stop VOD finder thread
-        if self.vod_finder_thread and self.vod_finder_thread.isRunning():
-            self.log_message("⏹️ Stopping VOD finder thread...")
-            self.vod_finder_thread.stop()
-            if not self.vod_finder_thread.wait(2000):
-                self.log_message("⚠️ VOD finder thread did not stop gracefully, terminating...")
-                self.vod_finder_thread.terminate()
-                self.vod_finder_thread.wait(1000)
+        # Stop the pooled extraction and VOD finder jobs
+        if self.extraction_task:
+            self.log_message("⏹️ Stopping extraction...")
+            self.extraction_task.stop()
+        
+        if self.vod_finder_task:
+            self.log_message("⏹️ Stopping VOD finder...")
+            self.vod_finder_task.stop()
+        
+        # Jobs still unwinding keep their references until they report finished
+        if QThreadPool.globalInstance().waitForDone(2000):
+            self.extraction_task = None
+            self.vod_finder_task = None
+        else:
+            self.log_message("⚠️ Background jobs did not stop within 2 seconds")
         
         # Stop download thread
         if self.download_thread and self.download_thread.isRunning():
@@ -1800,13 +2201,10 @@ class M3U8Downloader(QWidget):
             self.download_thread.abort()
             
             if not self.download_thread.wait(2000):
-                self.log_message("⚠️ Download thread did not stop gracefully, terminating...")
-                self.download_thread.terminate()
-                self.download_thread.wait(1000)
+                self.log_message("⚠️ Download thread did not stop within 2 seconds")
+                _keep_until_finished(self.download_thread)
         
         # Clean up any remaining thread references
-        self.extraction_thread = None
-        self.vod_finder_thread = None
         self.download_thread = None
         
         self.log_message("✅ M3U8 Downloader shutdown complete")
@@ -1816,23 +2214,18 @@ class M3U8Downloader(QWidget):
         """Destructor - no cleanup"""
         try:
             # Stop all threads if they're still running
-            if hasattr(self, 'extraction_thread') and self.extraction_thread and self.extraction_thread.isRunning():
-                self.extraction_thread.stop()
-                self.extraction_thread.wait(500)
-                if self.extraction_thread.isRunning():
-                    self.extraction_thread.terminate()
+            if hasattr(self, 'extraction_task') and self.extraction_task:
+                self.extraction_task.stop()
+                _keep_until_finished(self.extraction_task, self.extraction_task.signals.finished)
             
-            if hasattr(self, 'vod_finder_thread') and self.vod_finder_thread and self.vod_finder_thread.isRunning():
-                self.vod_finder_thread.stop()
-                self.vod_finder_thread.wait(500)
-                if self.vod_finder_thread.isRunning():
-                    self.vod_finder_thread.terminate()
+            if hasattr(self, 'vod_finder_task') and self.vod_finder_task:
+                self.vod_finder_task.stop()
+                _keep_until_finished(self.vod_finder_task, self.vod_finder_task.signals.finished)
             
             if hasattr(self, 'download_thread') and self.download_thread and self.download_thread.isRunning():
                 self.download_thread.abort()
-                self.download_thread.wait(1000)
-                if self.download_thread.isRunning():
-                    self.download_thread.terminate()
+                if not self.download_thread.wait(1000):
+                    _keep_until_finished(self.download_thread)
         
         except Exception:
             pass  # Ignore errors in destructor     
\ No newline at end of file
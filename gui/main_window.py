@@ -6,10 +6,12 @@ from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QFont, QPalette, QColor, QIcon
 from gui.streamer_card import StreamerCard
 from gui.help_dialog import HelpDialog
-from gui.m3u8_downloader import M3U8Downloader
-from gui.video_tools import VideoTools
 import re
 from PySide6.QtGui import QIcon
+
+# Channel URL with optional scheme and www (also covers bare twitch.tv/... input)
+_TWITCH_CHANNEL_URL_RE = re.compile(r'(?:https?://)?(?:www\.)?twitch\.tv/([a-zA-Z0-9_]+)')
+
 class MainWindow(QMainWindow):
     def __init__(self, stream_manager, config):
         super().__init__()
@@ -54,13 +56,15 @@ class MainWindow(QMainWindow):
         self.streamers_widget = self.create_streamers_tab()
         self.tab_widget.addTab(self.streamers_widget, "📺 Streamers")
         
-        # Create M3U8 downloader tab
-        self.m3u8_widget = M3U8Downloader(self.config)
-        self.tab_widget.addTab(self.m3u8_widget, "📥 Find/Download VOD")
-        
-        # Create video tools tab
-        self.video_tools_widget = VideoTools(self.config)
-        self.tab_widget.addTab(self.video_tools_widget, "🎬 Video Tools")
+        # The M3U8 downloader and video tools tabs pull in selenium, aiohttp and
+        # friends, so they start as empty pages and are built on first selection
+        self.m3u8_widget = None
+        self.video_tools_widget = None
+        self._lazy_tabs = {
+            self.tab_widget.addTab(self._create_tab_page(), "📥 Find/Download VOD"): self._make_m3u8_tab,
+            self.tab_widget.addTab(self._create_tab_page(), "🎬 Video Tools"): self._make_video_tools_tab,
+        }
+        self.tab_widget.currentChanged.connect(self._build_lazy_tab)
         
         main_layout.addWidget(self.tab_widget)
         
@@ -71,6 +75,29 @@ class MainWindow(QMainWindow):
         self.stream_manager.status_updated.connect(self.update_streamer_status)
         self.stream_manager.download_progress.connect(self.update_download_progress)
         
+    def _create_tab_page(self):
+        """Empty page that a lazily built tab widget is added to"""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        return page
+    
+    def _build_lazy_tab(self, index):
+        """Build a tab's widget the first time the tab is selected"""
+        make_widget = self._lazy_tabs.pop(index, None)
+        if make_widget:
+            self.tab_widget.widget(index).layout().addWidget(make_widget())
+    
+    def _make_m3u8_tab(self):
+        from gui.m3u8_downloader import M3U8Downloader
+        self.m3u8_widget = M3U8Downloader(self.config)
+        return self.m3u8_widget
+    
+    def _make_video_tools_tab(self):
+        from gui.video_tools import VideoTools
+        self.video_tools_widget = VideoTools(self.config)
+        return self.video_tools_widget
+    
     def create_streamers_tab(self):
         """Create the streamers tab with grid layout"""
         widget = QWidget()
@@ -209,16 +236,9 @@ class MainWindow(QMainWindow):
         input_text = input_text.strip()
         
         # Check if it's a URL
-        url_patterns = [
-            r'(?:https?://)?(?:www\.)?twitch\.tv/([a-zA-Z0-9_]+)',
-            r'twitch\.tv/([a-zA-Z0-9_]+)',
-            r'www\.twitch\.tv/([a-zA-Z0-9_]+)'
-        ]
-        
-        for pattern in url_patterns:
-            match = re.match(pattern, input_text)
-            if match:
-                return match.group(1)
+        match = _TWITCH_CHANNEL_URL_RE.match(input_text)
+        if match:
+            return match.group(1)
         
         # If not a URL, return as is (assuming it's a username)
         return input_text
@@ -234,12 +254,12 @@ class MainWindow(QMainWindow):
         # Check if already added
         if streamer_name.lower() in self.streamer_cards:
             # Flash the existing card
-            card = self.streamer_cards[streamer_name.lower()]
-            original_style = card.styleSheet()
-            card.setStyleSheet(original_style.replace("#3a3a3a", "#5a5a5a"))
-            QTimer.singleShot(200, lambda: card.setStyleSheet(original_style))
+            self.streamer_cards[streamer_name.lower()].flash()
             return
             
+        # Save to config first; the card caches the settings entry created here
+        self.config.add_streamer(streamer_name)
+        
         # Create new card
         card = StreamerCard(streamer_name, self.stream_manager, self.config)
         card.remove_requested.connect(lambda: self.remove_streamer(streamer_name))
@@ -248,9 +268,6 @@ class MainWindow(QMainWindow):
         self.streamers_layout.addWidget(card)
         self.streamer_cards[streamer_name.lower()] = card
         
-        # Save to config
-        self.config.add_streamer(streamer_name)
-        
         # Clear input
         self.streamer_input.clear()
         
@@ -277,19 +294,28 @@ class MainWindow(QMainWindow):
             
     def load_streamers(self):
         """Load saved streamers from config"""
-        for streamer_name in self.config.get_streamers():
-            # Get the saved settings for this streamer
-            settings = self.config.get_streamer_settings(streamer_name)
-            
-            card = StreamerCard(streamer_name, self.stream_manager, self.config)
-            card.remove_requested.connect(lambda name=streamer_name: self.remove_streamer(name))
-            
-            self.streamers_layout.addWidget(card)
-            self.streamer_cards[streamer_name.lower()] = card
-            
-            # Check initial status BEFORE loading settings
-            # This will trigger update_status which sets is_live
-            self.stream_manager.check_streamer_status(streamer_name) 
+        streamer_names = self.config.get_streamers()
+        
+        # Add every card before the container repaints, so it lays out once
+        self.streamers_container.setUpdatesEnabled(False)
+        try:
+            for streamer_name in streamer_names:
+                card = StreamerCard(streamer_name, self.stream_manager, self.config)
+                card.remove_requested.connect(lambda name=streamer_name: self.remove_streamer(name))
+                
+                self.streamers_layout.addWidget(card)
+                self.streamer_cards[streamer_name.lower()] = card
+        finally:
+            self.streamers_container.setUpdatesEnabled(True)
+        
+        # Check initial status once the event loop is running rather than during
+        # window construction; each result triggers update_status which sets is_live
+        QTimer.singleShot(0, lambda: self.check_streamers_status(streamer_names))
+        
+    def check_streamers_status(self, streamer_names):
+        """Start one batched status check for the given streamers"""
+        self.stream_manager.check_streamers_status(streamer_names)
+        
     def update_streamer_status(self, streamer_name, is_live):
         """Update streamer card status"""
         card = self.streamer_cards.get(streamer_name.lower())
@@ -304,11 +330,11 @@ class MainWindow(QMainWindow):
             
     def show_help(self):
         """Show help dialog"""
-        dialog = HelpDialog(self)
-        dialog.exec()
+        HelpDialog.open_for(self)
         
     def closeEvent(self, event):
         """Handle application close event"""
+        self.stream_manager.stop_status_checks()
         self.stream_manager.stop_all_downloads()
         self.config.save()
         event.accept()
\ No newline at end of file
@@ -2,30 +2,104 @@
 from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
                                QLabel, QCheckBox, QFrame, QFileDialog, QComboBox,
                                QMessageBox)
-from PySide6.QtCore import Signal, Qt, QTimer
+from PySide6.QtCore import Signal, Slot, Qt, QTimer
 from PySide6.QtGui import QFont
 import os
-from datetime import datetime
-from utils.file_naming import FileNamingUtils
+import subprocess
+import time
+
+def _open_native(path):
+    """Open a file or folder with the platform's default handler, without a shell"""
+    # The launcher reports a missing path itself, so don't stat first
+    try:
+        if os.name == 'nt':
+            os.startfile(path)
+        elif os.name == 'posix':
+            subprocess.Popen(["open", path], close_fds=True)
+    except OSError:
+        pass
 
 class StreamerCard(QFrame):
     remove_requested = Signal()
     
+    # Status label styles, shared by every card
+    LIVE_STYLE = "color: #ff0000; font-weight: bold; font-size: 12px;"
+    OFFLINE_STYLE = "color: #888888; font-size: 12px;"
+    # Minimum seconds between download info label updates
+    INFO_UPDATE_INTERVAL = 0.5
+    
+    # Button styles, built once and shared by every card
+    _ICON_STYLE_DEFAULT = """
+        QPushButton {
+            background-color: #4a4a4a;
+            border: none;
+            border-radius: 5px;
+            font-size: 14px;
+        }
+        QPushButton:hover {
+            background-color: #5a5a5a;
+        }
+    """
+    _ICON_STYLE_DANGER = """
+        QPushButton {
+            background-color: #4a4a4a;
+            border: none;
+            border-radius: 5px;
+            font-size: 14px;
+        }
+        QPushButton:hover {
+            background-color: #d32f2f;
+        }
+    """
+    _COMPACT_BTN_STYLE = """
+        QPushButton {
+            padding: 6px 12px;
+            background-color: #4a4a4a;
+            border: none;
+            border-radius: 5px;
+            color: #ffffff;
+            font-weight: bold;
+            font-size: 12px;
+            min-height: 28px;
+        }
+        QPushButton:hover:enabled {
+            background-color: #5a5a5a;
+        }
+        QPushButton:pressed:enabled {
+            background-color: #6a6a6a;
+        }
+        QPushButton:disabled {
+            background-color: #3a3a3a;
+            color: #666666;
+        }
+    """
+    
     def __init__(self, streamer_name, stream_manager, config):
         super().__init__()
         self.streamer_name = streamer_name
         self.stream_manager = stream_manager
         self.config = config
+        # Settings only change through this card or its settings dialog
+        self._settings_cache = self.config.get_streamer_settings(self.streamer_name)
         self.is_live = False
         self.is_downloading = False
         self.is_clipping = False
         self.download_filename = None
         self.download_timestamp = None
+        self._last_size = None  # Size last shown in the download info label
+        self._last_label_update = 0.0
+        self._cached_minute = -1
+        self._cached_timestamp_str = ""
+        self._status_shown = False  # Live state the status label currently shows
         self._settings_loaded = False
         self._initial_status_checked = False
         self._auto_download_override = False
+        # Resolved output directories
+        self._vod_path = None
+        self._clips_path = None
         
-        self.clip_message_timer = QTimer()
+        # One timer per card, so repeated saves restart it instead of stacking shots
+        self.clip_message_timer = QTimer(self)
         self.clip_message_timer.timeout.connect(self.revert_clip_message)
         self.clip_message_timer.setSingleShot(True)
         
@@ -40,6 +114,9 @@ class StreamerCard(QFrame):
         QFrame:hover {
             border-color: #5a5a5a;
         }
+        QFrame[flash="true"], QFrame[flash="true"] QFrame {
+            background-color: #5a5a5a;
+        }
         """)
         
         self.setMinimumSize(280, 220)
@@ -59,17 +136,17 @@ class StreamerCard(QFrame):
         self.name_label.setFont(QFont("Arial", 13, QFont.Bold))
         
         self.status_label = QLabel("⚫ Offline")
-        self.status_label.setStyleSheet("color: #888888; font-size: 12px;")
+        self.status_label.setStyleSheet(self.OFFLINE_STYLE)
         
         self.settings_button = QPushButton("⚙️")
         self.settings_button.setFixedSize(32, 32)
         self.settings_button.clicked.connect(self.show_settings)
-        self.settings_button.setStyleSheet(self.get_icon_button_style())
+        self.settings_button.setStyleSheet(self._ICON_STYLE_DEFAULT)
         
         self.remove_button = QPushButton("❌")
         self.remove_button.setFixedSize(32, 32)
         self.remove_button.clicked.connect(self.remove_requested.emit)
-        self.remove_button.setStyleSheet(self.get_icon_button_style("#d32f2f"))
+        self.remove_button.setStyleSheet(self._ICON_STYLE_DANGER)
         
         header_layout.addWidget(self.name_label)
         header_layout.addWidget(self.status_label)
@@ -106,12 +183,12 @@ class StreamerCard(QFrame):
         self.download_button = QPushButton("📥 Download")
         self.download_button.clicked.connect(self.toggle_download)
         self.download_button.setEnabled(False)
-        self.download_button.setStyleSheet(self.get_compact_button_style())
+        self.download_button.setStyleSheet(self._COMPACT_BTN_STYLE)
         
         self.clip_button = QPushButton("💾 Clip")
         self.clip_button.clicked.connect(self.save_clip)
         self.clip_button.setEnabled(False)
-        self.clip_button.setStyleSheet(self.get_compact_button_style())
+        self.clip_button.setStyleSheet(self._COMPACT_BTN_STYLE)
         
         buttons_row1.addWidget(self.download_button)
         buttons_row1.addWidget(self.clip_button)
@@ -121,11 +198,11 @@ class StreamerCard(QFrame):
         
         self.vod_button = QPushButton("📁 VODs")
         self.vod_button.clicked.connect(self.open_vod_folder)
-        self.vod_button.setStyleSheet(self.get_compact_button_style())
+        self.vod_button.setStyleSheet(self._COMPACT_BTN_STYLE)
         
         self.clips_button = QPushButton("🎞️ Clips")
         self.clips_button.clicked.connect(self.open_clips_folder)
-        self.clips_button.setStyleSheet(self.get_compact_button_style())
+        self.clips_button.setStyleSheet(self._COMPACT_BTN_STYLE)
         
         buttons_row2.addWidget(self.vod_button)
         buttons_row2.addWidget(self.clips_button)
@@ -147,57 +224,32 @@ class StreamerCard(QFrame):
         main_layout.addWidget(self.download_info_label)
         main_layout.addWidget(self.clip_info_label)
         
-    def get_icon_button_style(self, hover_color="#5a5a5a"):
-        return f"""
-        QPushButton {{
-            background-color: #4a4a4a;
-            border: none;
-            border-radius: 5px;
-            font-size: 14px;
-        }}
-        QPushButton:hover {{
-            background-color: {hover_color};
-        }}
-        """
-        
-    def get_compact_button_style(self):
-        return """
-        QPushButton {
-            padding: 6px 12px;
-            background-color: #4a4a4a;
-            border: none;
-            border-radius: 5px;
-            color: #ffffff;
-            font-weight: bold;
-            font-size: 12px;
-            min-height: 28px;
-        }
-        QPushButton:hover:enabled {
-            background-color: #5a5a5a;
-        }
-        QPushButton:pressed:enabled {
-            background-color: #6a6a6a;
-        }
-        QPushButton:disabled {
-            background-color: #3a3a3a;
-            color: #666666;
-        }
-        """
-        
     def get_vod_path(self):
         """Get the hardcoded VODs directory path for this streamer"""
-        vod_path = self.config.get_streamer_vod_path(self.streamer_name)
-        os.makedirs(vod_path, exist_ok=True)
-        return vod_path
+        if self._vod_path is None:
+            self._vod_path = self.config.get_streamer_vod_path(self.streamer_name)
+        return self._vod_path
         
     def get_clips_path(self):
         """Get the hardcoded Clips directory path for this streamer"""
-        clips_path = self.config.get_streamer_clips_path(self.streamer_name)
+        if self._clips_path is None:
+            self._clips_path = self.config.get_streamer_clips_path(self.streamer_name)
+        return self._clips_path
+        
+    def _ensure_vod_path(self):
+        """Create the VODs directory if needed, when something is about to use it"""
+        vod_path = self.get_vod_path()
+        os.makedirs(vod_path, exist_ok=True)
+        return vod_path
+        
+    def _ensure_clips_path(self):
+        """Create the Clips directory if needed, when something is about to use it"""
+        clips_path = self.get_clips_path()
         os.makedirs(clips_path, exist_ok=True)
         return clips_path
         
     def load_settings(self):
-        settings = self.config.get_streamer_settings(self.streamer_name)
+        settings = self._settings_cache
         
         self.auto_download_checkbox.blockSignals(True)
         self.auto_clip_checkbox.blockSignals(True)
@@ -220,28 +272,47 @@ class StreamerCard(QFrame):
             if self.auto_clip_checkbox.isChecked() and not self.is_clipping:
                 self.start_clipping()
                 
+    def flash(self):
+        """Briefly highlight the card, e.g. when its streamer is added again"""
+        self._set_flash(True)
+        QTimer.singleShot(200, lambda: self._set_flash(False))
+        
+    def _set_flash(self, on):
+        self.setProperty("flash", on)
+        # Re-polish against the already parsed stylesheet instead of replacing it
+        for widget in (self, *self.findChildren(QFrame)):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+        
     def update_status(self, is_live):
         self.is_live = is_live
         self._initial_status_checked = True
         
-        if is_live:
-            self.status_label.setText("🔴 LIVE")
-            self.status_label.setStyleSheet("color: #ff0000; font-weight: bold; font-size: 12px;")
-            self.download_button.setEnabled(True)
-            self.check_and_start_auto_actions()
-        else:
-            self.status_label.setText("⚫ Offline")
-            self.status_label.setStyleSheet("color: #888888; font-size: 12px;")
-            self.download_button.setEnabled(False)
+        # Apply every widget change before the card repaints once
+        self.setUpdatesEnabled(False)
+        try:
+            # Periodic checks mostly repeat the current state; only restyle on a change
+            if is_live != self._status_shown:
+                self._status_shown = is_live
+                self.status_label.setText("🔴 LIVE" if is_live else "⚫ Offline")
+                self.status_label.setStyleSheet(self.LIVE_STYLE if is_live else self.OFFLINE_STYLE)
+            self.download_button.setEnabled(is_live)
             
-            if self.is_downloading:
-                self.stop_download(manual=False)
-            if self.is_clipping:
-                self.stop_clipping()
+            if is_live:
+                self.check_and_start_auto_actions()
+            else:
+                if self.is_downloading:
+                    self.stop_download(manual=False)
+                if self.is_clipping:
+                    self.stop_clipping()
+        finally:
+            self.setUpdatesEnabled(True)
                 
+    @Slot(int)
     def on_auto_download_changed(self, state):
-        is_checked = (state == 2)
+        is_checked = Qt.CheckState(state) == Qt.CheckState.Checked
         self.config.update_streamer_setting(self.streamer_name, 'auto_download', is_checked)
+        self._settings_cache['auto_download'] = is_checked
         
         if is_checked:
             self._auto_download_override = False
@@ -251,9 +322,11 @@ class StreamerCard(QFrame):
             if self.is_downloading:
                 self.stop_download(manual=False)
                 
+    @Slot(int)
     def on_auto_clip_changed(self, state):
-        is_checked = (state == 2)
+        is_checked = Qt.CheckState(state) == Qt.CheckState.Checked
         self.config.update_streamer_setting(self.streamer_name, 'auto_clip', is_checked)
+        self._settings_cache['auto_clip'] = is_checked
         
         if is_checked and not self.is_clipping:
             if self._initial_status_checked and self.is_live:
@@ -276,19 +349,21 @@ class StreamerCard(QFrame):
         self.is_downloading = True
         self.download_button.setText("⏹️ Stop")
         
-        settings = self.config.get_streamer_settings(self.streamer_name)
+        settings = self._settings_cache
         quality = settings.get('quality', 'best')
         output_format = settings.get('format', 'mp4')
         
         # Use the hardcoded VODs directory
-        download_path = self.get_vod_path()
+        download_path = self._ensure_vod_path()
         
         # Generate filename using new naming format
+        from utils.file_naming import FileNamingUtils
         self.download_filename = FileNamingUtils.generate_live_vod_name(self.streamer_name, output_format)
         
         self.stream_manager.start_download(self.streamer_name, quality, output_format, download_path)
         
-        timestamp_display = datetime.now().strftime("%H:%M")
+        timestamp_display = time.strftime("%H:%M")
+        self._last_size = "0 MB"
         self.download_info_label.setText(f"📥 {timestamp_display} - {self.download_filename} - 0 MB")
         
     def stop_download(self, manual=False):
@@ -315,16 +390,13 @@ class StreamerCard(QFrame):
             msg_box.exec()
             
             if msg_box.clickedButton() == open_btn:
-                if os.path.exists(full_path):
-                    if os.name == 'nt':
-                        os.startfile(full_path)
-                    elif os.name == 'posix':
-                        os.system(f'open "{full_path}"')
+                _open_native(full_path)
             elif msg_box.clickedButton() == folder_btn:
                 self.open_vod_folder()
                 
         self.stream_manager.stop_download(self.streamer_name)
         self.download_info_label.setText("")
+        self._last_size = None
         self.download_filename = None
         self.download_timestamp = None
         
@@ -334,6 +406,7 @@ class StreamerCard(QFrame):
             
         self.is_clipping = True
         self.clip_button.setEnabled(True)
+        self._ensure_clips_path()
         
         self.stream_manager.start_clipping(self.streamer_name)
         self.clip_info_label.setText("✂️ Click \"Clip\" to Save the Latest 3 mins of the Stream")
@@ -369,11 +442,7 @@ class StreamerCard(QFrame):
             msg_box.exec()
             
             if msg_box.clickedButton() == open_btn:
-                if os.path.exists(clip_path):
-                    if os.name == 'nt':
-                        os.startfile(clip_path)
-                    elif os.name == 'posix':
-                        os.system(f'open "{clip_path}"')
+                _open_native(clip_path)
             elif msg_box.clickedButton() == folder_btn:
                 self.open_clips_folder()
                 
@@ -388,32 +457,33 @@ class StreamerCard(QFrame):
             
     def open_vod_folder(self):
         """Open the VODs folder for this streamer"""
-        vod_path = self.get_vod_path()
-        
-        if os.path.exists(vod_path):
-            if os.name == 'nt':
-                os.startfile(vod_path)
-            elif os.name == 'posix':
-                os.system(f'open "{vod_path}"')
+        _open_native(self._ensure_vod_path())
                 
     def open_clips_folder(self):
         """Open the Clips folder for this streamer"""
-        clips_path = self.get_clips_path()
-        
-        if os.path.exists(clips_path):
-            if os.name == 'nt':
-                os.startfile(clips_path)
-            elif os.name == 'posix':
-                os.system(f'open "{clips_path}"')
+        _open_native(self._ensure_clips_path())
                 
     def show_settings(self):
         from gui.streamer_settings import StreamerSettingsDialog
         dialog = StreamerSettingsDialog(self.streamer_name, self.config, self)
         if dialog.exec():
+            self._settings_cache = self.config.get_streamer_settings(self.streamer_name)
             self.load_settings()
             
     def update_download_info(self, info):
         if self.is_downloading and self.download_filename:
             size = info.get('size', '0 MB')
-            timestamp_display = datetime.now().strftime("%H:%M")
-            self.download_info_label.setText(f"📥 {timestamp_display} - {self.download_filename} - {size}")
\ No newline at end of file
+            # Most progress ticks repeat the size already shown
+            if size == self._last_size:
+                return
+            now = time.monotonic()
+            if now - self._last_label_update < self.INFO_UPDATE_INTERVAL:
+                return
+            self._last_label_update = now
+            self._last_size = size
+            # The HH:MM text only changes when the wall-clock minute rolls over
+            minute = int(time.time() // 60)
+            if minute != self._cached_minute:
+                self._cached_minute = minute
+                self._cached_timestamp_str = time.strftime("%H:%M")
+            self.download_info_label.setText(f"📥 {self._cached_timestamp_str} - {self.download_filename} - {size}")
\ No newline at end of file
@@ -4,6 +4,76 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                QFormLayout)
 from PySide6.QtCore import Qt
 
+# Dark theme for the settings dialog, shared by every dialog opened
+SETTINGS_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #4a4a4a;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QComboBox {
+        background-color: #3a3a3a;
+        border: 1px solid #4a4a4a;
+        border-radius: 3px;
+        padding: 5px;
+        color: #ffffff;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid #ffffff;
+    }
+    QCheckBox {
+        color: #ffffff;
+    }
+    QCheckBox::indicator {
+        width: 18px;
+        height: 18px;
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: #3a3a3a;
+        border: 1px solid #4a4a4a;
+        border-radius: 3px;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #9147ff;
+        border: 1px solid #9147ff;
+        border-radius: 3px;
+    }
+    QPushButton {
+        background-color: #4a4a4a;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        color: #ffffff;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+    }
+    QPushButton:pressed {
+        background-color: #6a6a6a;
+    }
+"""
+
 class StreamerSettingsDialog(QDialog):
     def __init__(self, streamer_name, config, parent=None):
         super().__init__(parent)
@@ -16,74 +86,7 @@ class StreamerSettingsDialog(QDialog):
         self.setFixedSize(400, 300)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #4a4a4a;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QComboBox {
-                background-color: #3a3a3a;
-                border: 1px solid #4a4a4a;
-                border-radius: 3px;
-                padding: 5px;
-                color: #ffffff;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-            }
-            QCheckBox {
-                color: #ffffff;
-            }
-            QCheckBox::indicator {
-                width: 18px;
-                height: 18px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #3a3a3a;
-                border: 1px solid #4a4a4a;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #9147ff;
-                border: 1px solid #9147ff;
-                border-radius: 3px;
-            }
-            QPushButton {
-                background-color: #4a4a4a;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #6a6a6a;
-            }
-        """)
+        self.setStyleSheet(SETTINGS_DIALOG_QSS)
         
         self.setup_ui()
         self.load_settings()
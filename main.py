@@ -6,6 +6,7 @@ from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QTimer, QCoreApplication, QSocketNotifier
 from PySide6.QtGui import QIcon
 from gui.main_window import MainWindow
+from gui.help_dialog import HELP_DIALOG_QSS
 from utils.config import Config
 from utils.stream_manager import StreamManager
 from utils.file_naming import FileNamingUtils
@@ -26,6 +27,7 @@ class TwitchMonitorApp:
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("Twitch Monitor")
         self.app.setOrganizationName("TwitchMonitor")
+        self.app.setStyleSheet(self.app.styleSheet() + HELP_DIALOG_QSS)
         
         # Set application icon for taskbar (THIS IS THE KEY ADDITION)
         logo_path = Path("gui/logo.png")
@@ -104,6 +106,7 @@ class TwitchMonitorApp:
                 self.status_timer.stop()
                 
             if hasattr(self, 'stream_manager'):
+                self.stream_manager.stop_status_checks()
                 self.stream_manager.stop_all_downloads()
                 
                 import time
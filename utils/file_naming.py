@@ -7,6 +7,9 @@ from pathlib import Path
 class FileNamingUtils:
     """Utility class for consistent file naming across the application"""
     
+    # Characters that are not allowed in filenames, mapped to underscores
+    INVALID_CHARS_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+    
     @staticmethod
     def get_date_string():
         """Get formatted date string like 'June 5 2025'"""
@@ -20,10 +23,7 @@ class FileNamingUtils:
     @staticmethod
     def sanitize_filename(filename):
         """Remove invalid characters from filename"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        return filename.strip()
+        return filename.translate(FileNamingUtils.INVALID_CHARS_TABLE).strip()
     
     @staticmethod
     def generate_live_vod_name(streamer_name, extension="mp4"):
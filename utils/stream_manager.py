@@ -7,6 +7,7 @@ import sys
 import glob
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from PySide6.QtCore import QObject, Signal
 from utils.file_naming import FileNamingUtils
@@ -17,6 +18,8 @@ class StreamManager(QObject):
     
     SEGMENT_DURATION = 10
     ROLLING_CLIP_SECONDS = 180
+    # Upper bound on streamlink status probes running at once for a batch check
+    STATUS_CHECK_WORKERS = 8
     
     def __init__(self, config):
         super().__init__()
@@ -27,31 +30,73 @@ class StreamManager(QObject):
         self.offline_confirmations = {}  # Track consecutive offline checks
         self.OFFLINE_CONFIRMATIONS_NEEDED = 3  # Require 3 consecutive offline checks
         self.last_known_status = {}  # Track last known status for each streamer
+        self._status_executor = None  # Shared pool for batch status checks, created on first use
+        self._pending_status_checks = set()  # Streamers queued or being checked in the pool
+        self._status_lock = threading.Lock()
+        self._status_checks_stopped = False  # Set on shutdown; no new checks after that
         
+    def _check_status(self, streamer_name):
+        """Probe one streamer with streamlink and apply the result"""
+        try:
+            result = subprocess.run(
+                ['streamlink', '--json', f'twitch.tv/{streamer_name}'],
+                capture_output=True,
+                text=True,
+                timeout=10,
+                creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+            )
+            
+            is_live = result.returncode == 0 and 'streams' in result.stdout
+            
+            # Handle status with confirmation logic
+            self._handle_status_update(streamer_name, is_live)
+            
+        except Exception:
+            # On error, don't immediately mark as offline
+            # Only update if we have no active downloads/clips
+            if streamer_name not in self.active_downloads and streamer_name not in self.active_clips:
+                self.status_updated.emit(streamer_name, False)
+                
     def check_streamer_status(self, streamer_name):
-        def check():
-            try:
-                result = subprocess.run(
-                    ['streamlink', '--json', f'twitch.tv/{streamer_name}'],
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
-                    creationflags=subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        thread = threading.Thread(target=self._check_status, args=(streamer_name,), daemon=True)
+        thread.start()
+        
+    def check_streamers_status(self, streamer_names):
+        """Check a batch of streamers through one bounded worker pool
+        
+        Avoids starting a thread and a streamlink process for every streamer
+        at once when the whole list is checked together.
+        """
+        with self._status_lock:
+            if self._status_checks_stopped:
+                return
+            if self._status_executor is None:
+                self._status_executor = ThreadPoolExecutor(
+                    max_workers=self.STATUS_CHECK_WORKERS,
+                    thread_name_prefix="status-check"
                 )
+            for streamer_name in streamer_names:
+                # A check already queued or running will report soon enough
+                if streamer_name in self._pending_status_checks:
+                    continue
+                self._pending_status_checks.add(streamer_name)
+                self._status_executor.submit(self._run_pooled_status_check, streamer_name)
                 
-                is_live = result.returncode == 0 and 'streams' in result.stdout
-                
-                # Handle status with confirmation logic
-                self._handle_status_update(streamer_name, is_live)
-                
-            except Exception:
-                # On error, don't immediately mark as offline
-                # Only update if we have no active downloads/clips
-                if streamer_name not in self.active_downloads and streamer_name not in self.active_clips:
-                    self.status_updated.emit(streamer_name, False)
+    def _run_pooled_status_check(self, streamer_name):
+        try:
+            self._check_status(streamer_name)
+        finally:
+            with self._status_lock:
+                self._pending_status_checks.discard(streamer_name)
                 
-        thread = threading.Thread(target=check, daemon=True)
-        thread.start()
+    def stop_status_checks(self):
+        """Drop queued status checks, release the pool without waiting and refuse new ones"""
+        with self._status_lock:
+            self._status_checks_stopped = True
+            executor, self._status_executor = self._status_executor, None
+            self._pending_status_checks.clear()
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
         
     def stop_all_downloads(self, force=False):
         """Stop all active downloads and clips
@@ -110,8 +155,7 @@ class StreamManager(QObject):
                 self.offline_confirmations[streamer_name] = 0    
                 
     def check_all_streamers(self):
-        for streamer_name in self.config.get_streamers():
-            self.check_streamer_status(streamer_name)
+        self.check_streamers_status(self.config.get_streamers())
             
     def start_download(self, streamer_name, quality, output_format, download_path):
         if streamer_name in self.active_downloads: